@@ -9,11 +9,13 @@ from collections import defaultdict
 from django.conf import settings
 
 from django.core.management import BaseCommand
+from django.utils import timezone
 from registrar.management.commands.utility.epp_data_containers import EnumFilenames
 
 from registrar.models import TransitionDomain
 
 from registrar.management.commands.utility.terminal_helper import (
+    ScriptDataHelper,
     TerminalColors,
     TerminalHelper,
 )
@@ -181,6 +183,12 @@ class Command(BaseCommand):
         mapped_status = status_maps.get(status_to_map)
         return mapped_status
 
+    def save_transition_domains(self, to_create: list[TransitionDomain], to_update: list[TransitionDomain]):
+        """Writes the new and refreshed TransitionDomain entries in bulk"""
+        TransitionDomain.objects.bulk_create(to_create, batch_size=1000)
+        if to_update:
+            ScriptDataHelper.bulk_update_fields(TransitionDomain, to_update, ["status", "email_sent", "updated_at"])
+
     def print_summary_duplications(
         self,
         duplicate_domain_user_combos: list[TransitionDomain],
@@ -419,6 +427,13 @@ class Command(BaseCommand):
         # Parse the domain_contacts file and create TransitionDomain objects,
         # using the dictionaries from steps 1 & 2 to lookup needed information.
         to_create = []
+        # existing (unprocessed) entries whose status is refreshed from the file
+        to_update = []
+
+        # existing entries by (username, domain_name), loaded once rather than queried per row
+        existing_entries = defaultdict(list)
+        for entry in TransitionDomain.objects.all():
+            existing_entries[(entry.username, entry.domain_name)].append(entry)
 
         # keep track of statuses that don't match our available
         # status values
@@ -525,46 +540,43 @@ class Command(BaseCommand):
                     if existing_domain_user_pair not in duplicate_domain_user_combos:
                         duplicate_domain_user_combos.append(existing_domain_user_pair)
                 else:
-                    entry_exists = TransitionDomain.objects.filter(
-                        username=new_entry_email, domain_name=new_entry_domain_name
-                    ).exists()
-                    if entry_exists:
-                        try:
-                            existing_entry = TransitionDomain.objects.get(
-                                username=new_entry_email,
-                                domain_name=new_entry_domain_name,
-                            )
-
-                            if not existing_entry.processed:
-                                if existing_entry.status != new_entry_status:
-                                    TerminalHelper.print_conditional(
-                                        debug_on,
-                                        f"{TerminalColors.OKCYAN}"
-                                        f"Updating entry: {existing_entry}"
-                                        f"Status: {existing_entry.status} > {new_entry_status}"  # noqa
-                                        f"Email Sent: {existing_entry.email_sent} > {new_entry_emailSent}"  # noqa
-                                        f"{TerminalColors.ENDC}",
-                                    )
-                                    existing_entry.status = new_entry_status
-                                existing_entry.email_sent = new_entry_emailSent
-                                existing_entry.save()
-                            else:
+                    matching_entries = existing_entries[(new_entry_email, new_entry_domain_name)]
+                    if len(matching_entries) > 1:
+                        logger.info(
+                            f"{TerminalColors.FAIL}"
+                            f"!!! ERROR: duplicate entries exist in the"
+                            f"transtion_domain table for domain:"
+                            f"{new_entry_domain_name}"
+                            f"----------TERMINATING----------"
+                        )
+                        # keep the entries parsed so far, as the per-row saves used to
+                        self.save_transition_domains(to_create, to_update)
+                        sys.exit()
+                    elif matching_entries:
+                        existing_entry = matching_entries[0]
+                        if not existing_entry.processed:
+                            if existing_entry.status != new_entry_status:
                                 TerminalHelper.print_conditional(
                                     debug_on,
-                                    f"{TerminalColors.YELLOW}"
-                                    f"Skipping update on processed domain: {existing_entry}"
+                                    f"{TerminalColors.OKCYAN}"
+                                    f"Updating entry: {existing_entry}"
+                                    f"Status: {existing_entry.status} > {new_entry_status}"  # noqa
+                                    f"Email Sent: {existing_entry.email_sent} > {new_entry_emailSent}"  # noqa
                                     f"{TerminalColors.ENDC}",
                                 )
-
-                        except TransitionDomain.MultipleObjectsReturned:
-                            logger.info(
-                                f"{TerminalColors.FAIL}"
-                                f"!!! ERROR: duplicate entries exist in the"
-                                f"transtion_domain table for domain:"
-                                f"{new_entry_domain_name}"
-                                f"----------TERMINATING----------"
+                                existing_entry.status = new_entry_status
+                            existing_entry.email_sent = new_entry_emailSent
+                            # bulk_update skips auto_now, so bump updated_at as save() would
+                            existing_entry.updated_at = timezone.now()
+                            to_update.append(existing_entry)
+                            total_updated_domain_entries += 1
+                        else:
+                            TerminalHelper.print_conditional(
+                                debug_on,
+                                f"{TerminalColors.YELLOW}"
+                                f"Skipping update on processed domain: {existing_entry}"
+                                f"{TerminalColors.ENDC}",
                             )
-                            sys.exit()
 
                     else:
                         # no matching entry, make one
@@ -593,7 +605,7 @@ class Command(BaseCommand):
                     )
                     break
 
-        TransitionDomain.objects.bulk_create(to_create)
+        self.save_transition_domains(to_create, to_update)
         # Print a summary of findings (duplicate entries,
         # missing data..etc.)
         self.print_summary_duplications(duplicate_domain_user_combos, duplicate_domains, users_without_email)
@@ -12,6 +12,7 @@ from registrar.models import Portfolio, DraftDomain
 from registrar.models.user_portfolio_permission import UserPortfolioPermission
 from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
 from registrar.utility.csv_export import (
+    BufferedCsvFile,
     DomainDataFull,
     DomainDataType,
     DomainDataFederal,
@@ -468,6 +469,48 @@ class ExportDataTest(MockDbForIndividualTests, MockEppLib):
 
         return csv_content
 
+    @less_console_noise_decorator
+    @override_flag("organization_feature", active=True)
+    @override_flag("organization_requests", active=True)
+    def test_domain_request_data_type_user_region(self):
+        """Tests that DomainRequestDataType exports the region of each request's state/territory"""
+
+        # Create a portfolio and make the user an admin of it
+        portfolio = Portfolio.objects.create(creator=self.user, organization_name="Test Portfolio")
+        UserPortfolioPermission.objects.get_or_create(
+            portfolio=portfolio, user=self.user, roles=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN]
+        )
+
+        # Create domain requests with a lowercase, unmapped and missing state/territory
+        dd_1 = DraftDomain.objects.create(name="region1.gov")
+        dd_2 = DraftDomain.objects.create(name="region2.gov")
+        dd_3 = DraftDomain.objects.create(name="region3.gov")
+        dr_1 = DomainRequest.objects.create(
+            creator=self.user, requested_domain=dd_1, portfolio=portfolio, state_territory="ny"
+        )
+        dr_2 = DomainRequest.objects.create(
+            creator=self.user, requested_domain=dd_2, portfolio=portfolio, state_territory="ZZ"
+        )
+        dr_3 = DomainRequest.objects.create(creator=self.user, requested_domain=dd_3, portfolio=portfolio)
+
+        request = get_wsgi_request_object(client=self.client, user=self.user)
+        with patch(
+            "registrar.utility.csv_export.DomainRequestDataType.get_columns",
+            return_value=["Domain request", "Region"],
+        ):
+            csv_content = self._run_domain_request_data_type_user_export(request)
+
+        csv_content = csv_content.replace("\r\n", "\n")
+        self.assertIn("region1.gov,2\n", csv_content)
+        self.assertIn("region2.gov,N/A\n", csv_content)
+        self.assertIn("region3.gov,\n", csv_content)
+
+        # Clean up the created objects
+        dr_1.delete()
+        dr_2.delete()
+        dr_3.delete()
+        portfolio.delete()
+
     @less_console_noise_decorator
     def test_domain_data_full(self):
         """Shows security contacts, filtered by state"""
@@ -947,3 +990,19 @@ class HelperFunctions(MockDbForSharedTests):
             submitted_requests_sliced_at_end_date = DomainRequestExport.get_sliced_requests(filter_condition)
             expected_content = [3, 2, 0, 0, 0, 0, 1, 0, 0, 1]
             self.assertEqual(submitted_requests_sliced_at_end_date, expected_content)
+
+    def test_buffered_csv_file(self):
+        """BufferedCsvFile should pass writes through in chunks of at least buffer_size characters."""
+        csv_file = MagicMock()
+        buffered = BufferedCsvFile(csv_file, buffer_size=10)
+
+        buffered.write("12345\r\n")
+        csv_file.write.assert_not_called()
+
+        buffered.write("67890\r\n")
+        csv_file.write.assert_called_once_with("12345\r\n67890\r\n")
+
+        buffered.write("abc\r\n")
+        buffered.flush()
+        csv_file.write.assert_called_with("abc\r\n")
+        self.assertEqual(csv_file.write.call_count, 2)
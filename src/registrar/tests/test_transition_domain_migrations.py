@@ -2,6 +2,9 @@ import datetime
 
 from io import StringIO
 
+from django.db.models import Count
+from django.db.models.functions import Lower
+from django.forms.models import model_to_dict
 from django.test import TestCase
 
 from registrar.models import (
@@ -26,53 +29,59 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class TestProcessedMigrations(TestCase):
-    """This test case class is designed to verify the idempotency of migrations
-    related to domain transitions in the domain_request."""
+class _MigrationTestMixin:
+    """Shared helpers for test cases that run the domain migration scripts
+    against the files in registrar/tests/data."""
 
-    def setUp(self):
-        """Defines the file name of migration_json and the folder its contained in"""
-        self.test_data_file_location = "registrar/tests/data"
-        self.migration_json_filename = "test_migrationFilepaths.json"
-        self.user, _ = User.objects.get_or_create(username="igorvillian")
+    # These scripts only ever touch the default database
+    databases = {"default"}
+
+    test_data_file_location = "registrar/tests/data"
+    migration_json_filename = "test_migrationFilepaths.json"
+
+    @classmethod
+    def setUpClass(cls):
+        """Mocks TerminalHelper.query_yes_no_exit, which is a user prompt in the terminal,
+        for the whole class. The mock function always returns True, allowing the scripts
+        to proceed without manual user input."""
+        patcher = patch(
+            "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",
+            return_value=True,
+        )
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        super().setUpClass()
 
     def tearDown(self):
         """Deletes all DB objects related to migrations"""
+        super().tearDown()
         # Delete domain information
+        TransitionDomain.objects.all().delete()
         Domain.objects.all().delete()
         DomainInformation.objects.all().delete()
         DomainInvitation.objects.all().delete()
-        TransitionDomain.objects.all().delete()
 
         # Delete users
         User.objects.all().delete()
         UserDomainRole.objects.all().delete()
 
-    def run_load_domains(self):
+    @classmethod
+    def run_load_domains(cls):
         """
         This method executes the load_transition_domain command.
 
-        It uses 'unittest.mock.patch' to mock the TerminalHelper.query_yes_no_exit method,
-        which is a user prompt in the terminal. The mock function always returns True,
-        allowing the test to proceed without manual user input.
-
-        The 'call_command' function from Django's management framework is then used to
+        The 'call_command' function from Django's management framework is used to
         execute the load_transition_domain command with the specified arguments.
         """
         with less_console_noise():
-            # noqa here because splitting this up makes it confusing.
-            # ES501
-            with patch(
-                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
-                return_value=True,
-            ):
-                call_command(
-                    "load_transition_domain",
-                    self.migration_json_filename,
-                    directory=self.test_data_file_location,
-                )
+            call_command(
+                "load_transition_domain",
+                cls.migration_json_filename,
+                directory=cls.test_data_file_location,
+            )
 
-    def run_transfer_domains(self):
+    @classmethod
+    def run_transfer_domains(cls):
         """
         This method executes the transfer_transition_domains_to_domains command.
 
@@ -82,6 +91,107 @@ class TestProcessedMigrations(TestCase):
         with less_console_noise():
             call_command("transfer_transition_domains_to_domains")
 
+    def run_load_organization_data(self):
+        """
+        This method executes the load_organization_data command.
+
+        The 'call_command' function from Django's management framework is used to
+        execute the load_organization_data command with the specified arguments.
+        """
+        with less_console_noise():
+            call_command(
+                "load_organization_data",
+                self.migration_json_filename,
+                directory=self.test_data_file_location,
+            )
+
+    def compare_tables(
+        self,
+        expected_total_transition_domains,
+        expected_total_domains,
+        expected_total_domain_informations,
+        expected_total_domain_invitations,
+        expected_missing_domains,
+        expected_duplicate_domains,
+        expected_missing_domain_informations,
+        expected_missing_domain_invitations,
+    ):
+        """Does a diff between the transition_domain and the following tables:
+        domain, domain_information and the domain_invitation.
+        Verifies that the data loaded correctly."""
+
+        missing_domains = []
+        duplicate_domains = []
+        missing_domain_informations = []
+        missing_domain_invites = []
+
+        # Load each comparison table once rather than querying per transition domain
+        domain_name_counts = dict(
+            Domain.objects.values("name").annotate(count=Count("id")).values_list("name", "count")
+        )
+        domain_information_names = set(DomainInformation.objects.values_list("domain__name", flat=True))
+        domain_invitation_keys = set(
+            DomainInvitation.objects.annotate(lower_email=Lower("email")).values_list("domain__name", "lower_email")
+        )
+
+        for transition_domain_name, transition_domain_email in TransitionDomain.objects.values_list(
+            "domain_name", "username"
+        ):
+            # Check Domain table
+            matching_domains = domain_name_counts.get(transition_domain_name, 0)
+
+            if matching_domains == 0:
+                missing_domains.append(transition_domain_name)
+            elif matching_domains > 1:
+                duplicate_domains.append(transition_domain_name)
+            # Check Domain Information table
+            if transition_domain_name not in domain_information_names:
+                missing_domain_informations.append(transition_domain_name)
+            # Check Domain Invitation table
+            if (transition_domain_name, transition_domain_email.lower()) not in domain_invitation_keys:
+                missing_domain_invites.append(transition_domain_name)
+
+        total_missing_domains = len(missing_domains)
+        total_duplicate_domains = len(duplicate_domains)
+        total_missing_domain_informations = len(missing_domain_informations)
+        total_missing_domain_invitations = len(missing_domain_invites)
+
+        total_transition_domains = TransitionDomain.objects.count()
+        total_domains = Domain.objects.count()
+        total_domain_informations = DomainInformation.objects.count()
+        total_domain_invitations = DomainInvitation.objects.count()
+
+        logger.debug(
+            f"""
+        total_missing_domains = {total_missing_domains}
+        total_duplicate_domains = {total_duplicate_domains}
+        total_missing_domain_informations = {total_missing_domain_informations}
+        total_missing_domain_invitations = {total_missing_domain_invitations}
+
+        total_transition_domains = {total_transition_domains}
+        total_domains = {total_domains}
+        total_domain_informations = {total_domain_informations}
+        total_domain_invitations = {total_domain_invitations}
+        """
+        )
+        self.assertEqual(total_missing_domains, expected_missing_domains)
+        self.assertEqual(total_duplicate_domains, expected_duplicate_domains)
+        self.assertEqual(total_missing_domain_informations, expected_missing_domain_informations)
+        self.assertEqual(total_missing_domain_invitations, expected_missing_domain_invitations)
+
+        self.assertEqual(total_transition_domains, expected_total_transition_domains)
+        self.assertEqual(total_domains, expected_total_domains)
+        self.assertEqual(total_domain_informations, expected_total_domain_informations)
+        self.assertEqual(total_domain_invitations, expected_total_domain_invitations)
+
+
+class TestProcessedMigrations(_MigrationTestMixin, TestCase):
+    """This test case class is designed to verify the idempotency of migrations
+    related to domain transitions in the domain_request."""
+
+    def setUp(self):
+        self.user, _ = User.objects.get_or_create(username="igorvillian")
+
     def test_domain_idempotent(self):
         """
         This test ensures that the domain transfer process
@@ -179,129 +289,14 @@ class TestProcessedMigrations(TestCase):
             self.assertTrue(transition_domain_object.processed)
 
 
-class TestOrganizationMigration(TestCase):
+class TestOrganizationMigration(_MigrationTestMixin, TestCase):
     def setUp(self):
-        """Defines the file name of migration_json and the folder its contained in"""
-        self.test_data_file_location = "registrar/tests/data"
-        self.migration_json_filename = "test_migrationFilepaths.json"
         self.federal_agency, _ = FederalAgency.objects.get_or_create(agency="Department of Commerce")
 
     def tearDown(self):
-        """Deletes all DB objects related to migrations"""
-        # Delete domain information
-        Domain.objects.all().delete()
-        DomainInformation.objects.all().delete()
-        DomainInvitation.objects.all().delete()
-        TransitionDomain.objects.all().delete()
-
-        # Delete users
-        User.objects.all().delete()
-        UserDomainRole.objects.all().delete()
+        super().tearDown()
         self.federal_agency.delete()
 
-    def run_load_domains(self):
-        """
-        This method executes the load_transition_domain command.
-
-        It uses 'unittest.mock.patch' to mock the TerminalHelper.query_yes_no_exit method,
-        which is a user prompt in the terminal. The mock function always returns True,
-        allowing the test to proceed without manual user input.
-
-        The 'call_command' function from Django's management framework is then used to
-        execute the load_transition_domain command with the specified arguments.
-        """
-        with less_console_noise():
-            # noqa here because splitting this up makes it confusing.
-            # ES501
-            with patch(
-                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
-                return_value=True,
-            ):
-                call_command(
-                    "load_transition_domain",
-                    self.migration_json_filename,
-                    directory=self.test_data_file_location,
-                )
-
-    def run_transfer_domains(self):
-        """
-        This method executes the transfer_transition_domains_to_domains command.
-
-        The 'call_command' function from Django's management framework is then used to
-        execute the load_transition_domain command with the specified arguments.
-        """
-        with less_console_noise():
-            call_command("transfer_transition_domains_to_domains")
-
-    def run_load_organization_data(self):
-        """
-        This method executes the load_organization_data command.
-
-        It uses 'unittest.mock.patch' to mock the TerminalHelper.query_yes_no_exit method,
-        which is a user prompt in the terminal. The mock function always returns True,
-        allowing the test to proceed without manual user input.
-
-        The 'call_command' function from Django's management framework is then used to
-        execute the load_organization_data command with the specified arguments.
-        """
-        with less_console_noise():
-            # noqa here (E501) because splitting this up makes it
-            # confusing to read.
-            with patch(
-                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
-                return_value=True,
-            ):
-                call_command(
-                    "load_organization_data",
-                    self.migration_json_filename,
-                    directory=self.test_data_file_location,
-                )
-
-    def compare_tables(
-        self,
-        expected_total_transition_domains,
-        expected_total_domains,
-        expected_total_domain_informations,
-        expected_missing_domains,
-        expected_duplicate_domains,
-        expected_missing_domain_informations,
-    ):
-        """Does a diff between the transition_domain and the following tables:
-        domain, domain_information and the domain_invitation.
-        Verifies that the data loaded correctly."""
-        missing_domains = []
-        duplicate_domains = []
-        missing_domain_informations = []
-        for transition_domain in TransitionDomain.objects.all():
-            transition_domain_name = transition_domain.domain_name
-            # Check Domain table
-            matching_domains = Domain.objects.filter(name=transition_domain_name)
-            # Check Domain Information table
-            matching_domain_informations = DomainInformation.objects.filter(domain__name=transition_domain_name)
-
-            if len(matching_domains) == 0:
-                missing_domains.append(transition_domain_name)
-            elif len(matching_domains) > 1:
-                duplicate_domains.append(transition_domain_name)
-            if len(matching_domain_informations) == 0:
-                missing_domain_informations.append(transition_domain_name)
-
-        total_missing_domains = len(missing_domains)
-        total_duplicate_domains = len(duplicate_domains)
-        total_missing_domain_informations = len(missing_domain_informations)
-
-        total_transition_domains = len(TransitionDomain.objects.all())
-        total_domains = len(Domain.objects.all())
-        total_domain_informations = len(DomainInformation.objects.all())
-
-        self.assertEqual(total_missing_domains, expected_missing_domains)
-        self.assertEqual(total_duplicate_domains, expected_duplicate_domains)
-        self.assertEqual(total_missing_domain_informations, expected_missing_domain_informations)
-
-        self.assertEqual(total_transition_domains, expected_total_transition_domains)
-        self.assertEqual(total_domains, expected_total_domains)
-        self.assertEqual(total_domain_informations, expected_total_domain_informations)
-
     def test_load_organization_data_transition_domain(self):
         """
         This test verifies the functionality of the load_organization_data method for TransitionDomain objects.
@@ -325,38 +320,37 @@ class TestOrganizationMigration(TestCase):
             self.run_load_organization_data()
 
             # == Third, test that we've loaded data as we expect == #
-            transition_domains = TransitionDomain.objects.filter(domain_name="fakewebsite2.gov")
+            expected_transition_domain = {
+                "username": "alexandra.bobbitt5@test.com",
+                "domain_name": "fakewebsite2.gov",
+                "status": "on hold",
+                "email_sent": False,
+                "organization_name": "Fanoodle",
+                "federal_agency": "Department of Commerce",
+                "first_name": "Seline",
+                "middle_name": "testmiddle2",
+                "last_name": "Tower",
+                "title": None,
+                "email": "stower3@answers.com",
+                "phone": "151-539-6028",
+                "address_line": "93001 Arizona Drive",
+                "city": "Columbus",
+                "state_territory": "Ohio",
+                "zipcode": "43268",
+            }
+            transition_domains = list(
+                TransitionDomain.objects.filter(domain_name="fakewebsite2.gov")
+                .only(*expected_transition_domain)
+                .order_by("id")
+            )
 
             # Should return three objects (three unique emails)
-            self.assertEqual(transition_domains.count(), 3)
+            self.assertEqual(len(transition_domains), 3)
 
             # Lets test the first one
-            transition = transition_domains.first()
-            expected_transition_domain = TransitionDomain(
-                username="alexandra.bobbitt5@test.com",
-                domain_name="fakewebsite2.gov",
-                status="on hold",
-                email_sent=True,
-                generic_org_type="Federal",
-                organization_name="Fanoodle",
-                federal_type="Executive",
-                federal_agency=self.federal_agency,
-                epp_creation_date=datetime.date(2004, 5, 7),
-                epp_expiration_date=datetime.date(2023, 9, 30),
-                first_name="Seline",
-                middle_name="testmiddle2",
-                last_name="Tower",
-                title=None,
-                email="stower3@answers.com",
-                phone="151-539-6028",
-                address_line="93001 Arizona Drive",
-                city="Columbus",
-                state_territory="Oh",
-                zipcode="43268",
-            )
-            expected_transition_domain.id = transition.id
+            transition = transition_domains[0]
 
-            self.assertEqual(transition, expected_transition_domain)
+            self.assertEqual(model_to_dict(transition, fields=expected_transition_domain), expected_transition_domain)
 
     def test_transition_domain_status_unknown(self):
         """
@@ -393,15 +387,16 @@ class TestOrganizationMigration(TestCase):
             self.run_load_organization_data()
 
             # == Third, test that we've loaded data as we expect == #
-            _domain = Domain.objects.filter(name="fakewebsite2.gov").get()
-            domain_information = DomainInformation.objects.filter(domain=_domain).get()
+            domain_information = DomainInformation.objects.select_related("domain", "creator", "senior_official").get(
+                domain__name="fakewebsite2.gov"
+            )
 
-            expected_creator = User.objects.filter(username="System").get()
+            system_user = User.objects.get(username="System")
             expected_so = Contact.objects.filter(
                 first_name="Seline", middle_name="testmiddle2", last_name="Tower"
             ).get()
             expected_domain_information = DomainInformation(
-                creator=expected_creator,
+                creator=system_user,
                 generic_org_type="federal",
                 federal_agency=self.federal_agency,
                 federal_type="executive",
@@ -411,11 +406,12 @@ class TestOrganizationMigration(TestCase):
                 state_territory="Oh",
                 zipcode="43268",
                 senior_official=expected_so,
-                domain=_domain,
+                domain=domain_information.domain,
             )
             # Given that these are different objects, this needs to be set
             expected_domain_information.id = domain_information.id
             self.assertEqual(domain_information, expected_domain_information)
+            self.assertEqual(domain_information.creator_id, system_user.id)
 
     def test_load_organization_data_preserves_existing_data(self):
         """
@@ -448,15 +444,16 @@ class TestOrganizationMigration(TestCase):
             self.run_load_organization_data()
 
             # == Fourth, test that no data is overwritten as we expect == #
-            _domain = Domain.objects.filter(name="fakewebsite2.gov").get()
-            domain_information = DomainInformation.objects.filter(domain=_domain).get()
+            domain_information = DomainInformation.objects.select_related("domain", "creator", "senior_official").get(
+                domain__name="fakewebsite2.gov"
+            )
 
-            expected_creator = User.objects.filter(username="System").get()
+            system_user = User.objects.get(username="System")
             expected_so = Contact.objects.filter(
                 first_name="Seline", middle_name="testmiddle2", last_name="Tower"
             ).get()
             expected_domain_information = DomainInformation(
-                creator=expected_creator,
+                creator=system_user,
                 generic_org_type="federal",
                 federal_agency=self.federal_agency,
                 federal_type="executive",
@@ -466,11 +463,12 @@ class TestOrganizationMigration(TestCase):
                 state_territory="MA",
                 zipcode="12345",
                 senior_official=expected_so,
-                domain=_domain,
+                domain=domain_information.domain,
             )
             # Given that these are different objects, this needs to be set
             expected_domain_information.id = domain_information.id
             self.assertEqual(domain_information, expected_domain_information)
+            self.assertEqual(domain_information.creator_id, system_user.id)
 
     def test_load_organization_data_integrity(self):
         """
@@ -497,28 +495,31 @@ class TestOrganizationMigration(TestCase):
             expected_total_transition_domains = 9
             expected_total_domains = 5
             expected_total_domain_informations = 5
+            expected_total_domain_invitations = 8
 
             expected_missing_domains = 0
             expected_duplicate_domains = 0
             expected_missing_domain_informations = 0
+            expected_missing_domain_invitations = 1
             self.compare_tables(
                 expected_total_transition_domains,
                 expected_total_domains,
                 expected_total_domain_informations,
+                expected_total_domain_invitations,
                 expected_missing_domains,
                 expected_duplicate_domains,
                 expected_missing_domain_informations,
+                expected_missing_domain_invitations,
             )
 
 
-class TestMigrations(TestCase):
+class TestMigrations(_MigrationTestMixin, TestCase):
     def setUp(self):
         """ """
         # self.load_transition_domain_script = "load_transition_domain",
         # self.transfer_script = "transfer_transition_domains_to_domains",
         # self.master_script = "load_transition_domain",
 
-        self.test_data_file_location = "registrar/tests/data"
         self.test_domain_contact_filename = "test_domain_contacts.txt"
         self.test_contact_filename = "test_contacts.txt"
         self.test_domain_status_filename = "test_domain_statuses.txt"
@@ -530,133 +531,21 @@ class TestMigrations(TestCase):
         self.test_domain_types_adhoc = "test_domain_types_adhoc.txt"
         self.test_escrow_domains_daily = "test_escrow_domains_daily"
         self.test_organization_adhoc = "test_organization_adhoc.txt"
-        self.migration_json_filename = "test_migrationFilepaths.json"
-
-    def tearDown(self):
-        super().tearDown()
-        # Delete domain information
-        TransitionDomain.objects.all().delete()
-        Domain.objects.all().delete()
-        DomainInformation.objects.all().delete()
-        DomainInvitation.objects.all().delete()
-
-        # Delete users
-        User.objects.all().delete()
-        UserDomainRole.objects.all().delete()
-
-    def run_load_domains(self):
-        with less_console_noise():
-            # noqa here because splitting this up makes it confusing.
-            # ES501
-            with patch(
-                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
-                return_value=True,
-            ):
-                call_command(
-                    "load_transition_domain",
-                    self.migration_json_filename,
-                    directory=self.test_data_file_location,
-                )
-
-    def run_transfer_domains(self):
-        with less_console_noise():
-            call_command("transfer_transition_domains_to_domains")
 
     def run_master_script(self):
         with less_console_noise():
-            # noqa here (E501) because splitting this up makes it
-            # confusing to read.
             mock_client = MockSESClient()
             with boto3_mocking.clients.handler_for("sesv2", mock_client):
-                with patch(
-                    "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
-                    return_value=True,
-                ):
-                    with patch("registrar.utility.email.send_templated_email", return_value=None):
-                        call_command(
-                            "master_domain_migrations",
-                            runMigrations=True,
-                            migrationDirectory=self.test_data_file_location,
-                            migrationJSON=self.migration_json_filename,
-                            disablePrompts=True,
-                        )
+                with patch("registrar.utility.email.send_templated_email", return_value=None):
+                    call_command(
+                        "master_domain_migrations",
+                        runMigrations=True,
+                        migrationDirectory=self.test_data_file_location,
+                        migrationJSON=self.migration_json_filename,
+                        disablePrompts=True,
+                    )
             logger.debug(f"here: {mock_client.EMAILS_SENT}")
 
-    def compare_tables(
-        self,
-        expected_total_transition_domains,
-        expected_total_domains,
-        expected_total_domain_informations,
-        expected_total_domain_invitations,
-        expected_missing_domains,
-        expected_duplicate_domains,
-        expected_missing_domain_informations,
-        expected_missing_domain_invitations,
-    ):
-        """Does a diff between the transition_domain and the following tables:
-        domain, domain_information and the domain_invitation.
-        Verifies that the data loaded correctly."""
-
-        missing_domains = []
-        duplicate_domains = []
-        missing_domain_informations = []
-        missing_domain_invites = []
-        for transition_domain in TransitionDomain.objects.all():  # DEBUG:
-            transition_domain_name = transition_domain.domain_name
-            transition_domain_email = transition_domain.username
-
-            # Check Domain table
-            matching_domains = Domain.objects.filter(name=transition_domain_name)
-            # Check Domain Information table
-            matching_domain_informations = DomainInformation.objects.filter(domain__name=transition_domain_name)
-            # Check Domain Invitation table
-            matching_domain_invitations = DomainInvitation.objects.filter(
-                email=transition_domain_email.lower(),
-                domain__name=transition_domain_name,
-            )
-
-            if len(matching_domains) == 0:
-                missing_domains.append(transition_domain_name)
-            elif len(matching_domains) > 1:
-                duplicate_domains.append(transition_domain_name)
-            if len(matching_domain_informations) == 0:
-                missing_domain_informations.append(transition_domain_name)
-            if len(matching_domain_invitations) == 0:
-                missing_domain_invites.append(transition_domain_name)
-
-        total_missing_domains = len(missing_domains)
-        total_duplicate_domains = len(duplicate_domains)
-        total_missing_domain_informations = len(missing_domain_informations)
-        total_missing_domain_invitations = len(missing_domain_invites)
-
-        total_transition_domains = len(TransitionDomain.objects.all())
-        total_domains = len(Domain.objects.all())
-        total_domain_informations = len(DomainInformation.objects.all())
-        total_domain_invitations = len(DomainInvitation.objects.all())
-
-        logger.debug(
-            f"""
-        total_missing_domains = {len(missing_domains)}
-        total_duplicate_domains = {len(duplicate_domains)}
-        total_missing_domain_informations = {len(missing_domain_informations)}
-        total_missing_domain_invitations = {total_missing_domain_invitations}
-
-        total_transition_domains = {len(TransitionDomain.objects.all())}
-        total_domains = {len(Domain.objects.all())}
-        total_domain_informations = {len(DomainInformation.objects.all())}
-        total_domain_invitations = {len(DomainInvitation.objects.all())}
-        """
-        )
-        self.assertEqual(total_missing_domains, expected_missing_domains)
-        self.assertEqual(total_duplicate_domains, expected_duplicate_domains)
-        self.assertEqual(total_missing_domain_informations, expected_missing_domain_informations)
-        self.assertEqual(total_missing_domain_invitations, expected_missing_domain_invitations)
-
-        self.assertEqual(total_transition_domains, expected_total_transition_domains)
-        self.assertEqual(total_domains, expected_total_domains)
-        self.assertEqual(total_domain_informations, expected_total_domain_informations)
-        self.assertEqual(total_domain_invitations, expected_total_domain_invitations)
-
     def test_master_migration_functions(self):
         """Run the full master migration script using local test data.
         NOTE: This is more of an integration test and so far does not
@@ -794,9 +683,15 @@ class TestMigrations(TestCase):
             self.run_transfer_domains()
 
             # Simluate Logins
-            for invite in DomainInvitation.objects.all():
-                # get a user with this email address
-                user, user_created = User.objects.get_or_create(email=invite.email, username=invite.email)
+            invite_emails = set(DomainInvitation.objects.values_list("email", flat=True))
+            # create a user for each invited email address that doesn't have one yet
+            existing_emails = set(
+                User.objects.filter(email__in=invite_emails, username__in=invite_emails).values_list("email", flat=True)
+            )
+            User.objects.bulk_create(
+                [User(email=email, username=email) for email in invite_emails if email not in existing_emails]
+            )
+            for user in User.objects.filter(email__in=invite_emails, username__in=invite_emails):
                 user.on_each_login()
 
             # Analyze the tables
@@ -820,13 +715,19 @@ class TestMigrations(TestCase):
                 expected_missing_domain_invitations,
             )
 
+
+class TestSendDomainInvitations(_MigrationTestMixin, TestCase):
+    """Tests for the send_domain_invitations script. The transition domains
+    are loaded and transferred once for the whole class."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.run_load_domains()
+        cls.run_transfer_domains()
+
     @boto3_mocking.patching
     def test_send_domain_invitations_email(self):
         """Can send only a single domain invitation email."""
-        with less_console_noise():
-            self.run_load_domains()
-            self.run_transfer_domains()
-
         # this is one of the email addresses in data/test_contacts.txt
         output_stream = StringIO()
 
@@ -845,10 +746,6 @@ class TestMigrations(TestCase):
     @boto3_mocking.patching
     def test_send_domain_invitations_two_emails(self):
         """Can send only a single domain invitation email."""
-        with less_console_noise():
-            self.run_load_domains()
-            self.run_transfer_domains()
-
         # these are two email addresses in data/test_contacts.txt
         output_stream = StringIO()
 
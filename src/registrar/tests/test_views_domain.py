@@ -290,6 +290,18 @@ class TestDomainDetail(TestDomainOverview):
             self.assertContains(detail_page, "ns1.justnameserver.com")
             self.assertContains(detail_page, "ns2.justnameserver.com")
 
+    @less_console_noise_decorator
+    def test_domain_detail_caches_registry_data_in_session(self):
+        """Registry data fetched while rendering the overview page is kept in the
+        session-cached domain, but related objects like domain_info are not"""
+        domain = self.domain_just_nameserver
+        response = self.client.get(reverse("domain", kwargs={"pk": domain.id}))
+        self.assertContains(response, "ns1.justnameserver.com")
+
+        cached_domain = self.client.session[f"domain:{domain.id}"]
+        self.assertIn("hosts", cached_domain._cache)
+        self.assertEqual(cached_domain._state.fields_cache, {})
+
     def test_domain_detail_see_nameserver_and_ip(self):
         with less_console_noise():
             # View nameserver on Domain Overview page
@@ -777,6 +789,28 @@ class TestDomainManagers(TestDomainOverview):
         success_page = success_result.follow()
         self.assertContains(success_page, "mayor@igorville.gov")
 
+    @less_console_noise_decorator
+    @patch("registrar.views.domain.send_domain_invitation_email")
+    def test_domain_user_add_form_existing_manager(self, mock_send_domain_email):
+        """Adding a user who is already a manager of the domain warns instead of adding them again."""
+        existing_user, _ = get_user_model().objects.get_or_create(email="mayor@igorville.gov")
+        UserDomainRole.objects.create(user=existing_user, domain=self.domain, role=UserDomainRole.Roles.MANAGER)
+        add_page = self.app.get(reverse("domain-users-add", kwargs={"pk": self.domain.id}))
+        session_id = self.app.cookies[settings.SESSION_COOKIE_NAME]
+
+        add_page.form["email"] = "mayor@igorville.gov"
+
+        self.app.set_cookie(settings.SESSION_COOKIE_NAME, session_id)
+        result = add_page.form.submit()
+
+        self.assertEqual(result.status_code, 302)
+        self.assertEqual(UserDomainRole.objects.filter(user=existing_user, domain=self.domain).count(), 1)
+
+        self.app.set_cookie(settings.SESSION_COOKIE_NAME, session_id)
+        result_page = result.follow()
+        self.assertContains(result_page, "mayor@igorville.gov is already a manager for this domain")
+        self.assertNotContains(result_page, "Added user mayor@igorville.gov.")
+
     @boto3_mocking.patching
     @override_flag("organization_feature", active=True)
     @less_console_noise_decorator
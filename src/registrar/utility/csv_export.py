@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from collections import defaultdict
 import csv
+from functools import lru_cache
+from itertools import islice
+from operator import methodcaller
 import logging
 from datetime import datetime
 from registrar.models import (
@@ -31,20 +33,51 @@ from django.db.models import (
     Exists,
     Func,
 )
+from django.http import HttpResponse
 from django.utils import timezone
 from django.db.models.functions import Concat, Coalesce, Cast
 from django.contrib.postgres.aggregates import ArrayAgg, StringAgg
 from django.contrib.admin.models import LogEntry, ADDITION
 from django.contrib.contenttypes.models import ContentType
-from registrar.models.utility.generic_helper import convert_queryset_to_dict
 from registrar.models.utility.orm_helper import ArrayRemoveNull
 from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
-from registrar.templatetags.custom_filters import get_region
+from registrar.templatetags.custom_filters import REGIONS
 from registrar.utility.constants import BranchChoices
 from registrar.utility.enums import DefaultEmail, DefaultUserValues
 
 logger = logging.getLogger(__name__)
 
+# Size (in characters) of the chunks written to an HttpResponse
+DEFAULT_CSV_BUFFER_SIZE = 1 << 20
+
+# Rows handed to csv.writer.writerows at a time
+DEFAULT_CSV_CHUNK_SIZE = 10000
+
+# Rows fetched per round trip when streaming exports from a server-side cursor
+EXPORT_ITERATOR_CHUNK_SIZE = 5000
+
+# Choice value -> label maps, so rows resolve labels with a dict lookup
+# rather than constructing the enum member each time.
+DOMAIN_STATE_LABELS = dict(Domain.State.choices)
+DOMAIN_REQUEST_STATUS_LABELS = dict(DomainRequest.DomainRequestStatus.choices)
+ORGANIZATION_LABELS = dict(DomainRequest.OrganizationChoices.choices)
+ORGANIZATION_ELECTION_OFFICE_LABELS = dict(DomainRequest.OrgChoicesElectionOffice.choices)
+BRANCH_LABELS = dict(BranchChoices.choices)
+
+# Default security contact emails, normalized, which are exported as blank
+INVALID_SECURITY_CONTACT_EMAILS = frozenset(
+    email.value.lower().strip() for email in (DefaultEmail.LEGACY_DEFAULT, DefaultEmail.PUBLIC_CONTACT_DEFAULT)
+)
+
+
+def get_label(labels, value, get_choice_label):
+    """
+    Returns the label for value from a precomputed labels dict.
+    Misses defer to get_choice_label, which handles empty and invalid values.
+    """
+    label = labels.get(value)
+    return label if label is not None else get_choice_label(value)
+
 
 def write_header(writer, columns):
     """
@@ -54,9 +87,54 @@ def write_header(writer, columns):
     writer.writerow(columns)
 
 
+class BufferedCsvFile:
+    """
+    Collects the many small writes made by csv.writer (one per row) and passes
+    them on to the wrapped file-like object in chunks of at least buffer_size characters.
+    Call flush() once writing is done.
+    """
+
+    def __init__(self, csv_file, buffer_size=DEFAULT_CSV_BUFFER_SIZE):
+        self.csv_file = csv_file
+        self.buffer_size = buffer_size
+        self._chunks = []
+        self._buffered = 0
+
+    def write(self, data):
+        self._chunks.append(data)
+        self._buffered += len(data)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self._chunks:
+            self.csv_file.write("".join(self._chunks))
+            self._chunks = []
+            self._buffered = 0
+
+
+# Header for the counts returned by get_sliced_domains, written above each set of counts
+SLICED_COUNTS_HEADER = [
+    "Total",
+    "Federal",
+    "Interstate",
+    "State or territory",
+    "Tribal",
+    "County",
+    "City",
+    "Special district",
+    "School district",
+    "Election office",
+]
+
+# A date that's prior to our first deployment
+DEFAULT_START_DATE = timezone.make_aware(datetime(2023, 11, 1))
+
+
 def get_default_start_date():
     """Default to a date that's prior to our first deployment"""
-    return timezone.make_aware(datetime(2023, 11, 1))
+    return DEFAULT_START_DATE
 
 
 def get_default_end_date():
@@ -64,12 +142,22 @@ def get_default_end_date():
     return timezone.now()
 
 
+@lru_cache(maxsize=64)
+def parse_date(date):
+    """Returns a timezone aware datetime for a YYYY-MM-DD string. Reports reuse a few dates, so they are cached."""
+    return timezone.make_aware(datetime.strptime(date, "%Y-%m-%d"))
+
+
 def format_start_date(start_date):
-    return timezone.make_aware(datetime.strptime(start_date, "%Y-%m-%d")) if start_date else get_default_start_date()
+    if isinstance(start_date, datetime):
+        return start_date
+    return parse_date(start_date) if start_date else get_default_start_date()
 
 
 def format_end_date(end_date):
-    return timezone.make_aware(datetime.strptime(end_date, "%Y-%m-%d")) if end_date else get_default_end_date()
+    if isinstance(end_date, datetime):
+        return end_date
+    return parse_date(end_date) if end_date else get_default_end_date()
 
 
 class BaseExport(ABC):
@@ -78,6 +166,9 @@ class BaseExport(ABC):
     Base class in an inheritance tree of 3.
     """
 
+    # Column name -> key in the model dictionary. Defined by subclasses.
+    FIELDS = {}
+
     @classmethod
     @abstractmethod
     def model(self):
@@ -174,6 +265,20 @@ class BaseExport(ABC):
         """
         pass
 
+    @classmethod
+    def get_model_fields(cls, include_many_to_many=False):
+        """
+        Get the names of the model's own fields to retrieve. Defaults to every field.
+        Override in subclasses that only need a few of them.
+        """
+        model_fields = set()
+        for field in cls.model()._meta.get_fields():
+            # Exclude many to many fields unless we specify
+            many_to_many = isinstance(field, ManyToManyField) and include_many_to_many
+            if many_to_many or not isinstance(field, ManyToManyField):
+                model_fields.add(field.name)
+        return model_fields
+
     @classmethod
     def annotate_and_retrieve_fields(
         cls, initial_queryset, computed_fields, related_table_fields=None, include_many_to_many=False, **kwargs
@@ -187,8 +292,7 @@ class BaseExport(ABC):
             computed_fields  (dict, optional): Fields to compute {field_name: expression}.
             related_table_fields (list, optional): Extra fields to retrieve; defaults to annotation keys if None.
             include_many_to_many (bool, optional): Determines if we should include many to many fields or not
-            **kwargs: Additional keyword arguments for specific parameters (e.g., public_contacts, domain_invitations,
-                  user_domain_roles).
+            **kwargs: Additional keyword arguments passed through to update_queryset.
 
         Returns:
             QuerySet: Contains dictionaries with the specified fields for each record.
@@ -202,32 +306,43 @@ class BaseExport(ABC):
             related_table_fields.extend(computed_fields.keys())
 
         # Get prexisting fields on the model
-        model_fields = set()
-        for field in cls.model()._meta.get_fields():
-            # Exclude many to many fields unless we specify
-            many_to_many = isinstance(field, ManyToManyField) and include_many_to_many
-            if many_to_many or not isinstance(field, ManyToManyField):
-                model_fields.add(field.name)
+        model_fields = cls.get_model_fields(include_many_to_many)
 
         queryset = initial_queryset.annotate(**computed_fields).values(*model_fields, *related_table_fields)
 
         return cls.update_queryset(queryset, **kwargs)
 
     @classmethod
-    def export_data_to_csv(cls, csv_file, **kwargs):
+    def export_data_to_csv(cls, csv_file, return_rows=False, buffer_size=DEFAULT_CSV_BUFFER_SIZE, **kwargs):
         """
         All domain metadata:
         Exports domains of all statuses plus domain managers.
+
+        Rows are streamed to csv_file. Pass return_rows=True to also get them back as a list.
+        An HttpResponse, which keeps every write as a separate chunk, is written to
+        in chunks of at most buffer_size characters (or DEFAULT_CSV_CHUNK_SIZE rows)
+        rather than once per row.
         """
-        writer = csv.writer(csv_file)
+        output = BufferedCsvFile(csv_file, buffer_size) if isinstance(csv_file, HttpResponse) else csv_file
+        writer = csv.writer(output)
         columns = cls.get_columns()
-        models_dict = cls.get_model_annotation_dict(**kwargs)
+
+        # Parse the report dates once, so the filters and the csv header sections share the same values
+        if kwargs.get("start_date"):
+            kwargs["start_date"] = format_start_date(kwargs["start_date"])
+        if kwargs.get("end_date"):
+            kwargs["end_date"] = format_end_date(kwargs["end_date"])
+
+        models = cls.get_models(**kwargs)
 
         # Write to csv file before the write_csv
         cls.write_csv_before(writer, **kwargs)
 
         # Write the csv file
-        rows = cls.write_csv(writer, columns, models_dict)
+        buffered = output is not csv_file
+        rows = cls.write_csv(writer, columns, models, return_rows=return_rows, flush=output.flush if buffered else None)
+        if buffered:
+            output.flush()
 
         # Return rows that for easier parsing and testing
         return rows
@@ -260,42 +375,76 @@ class BaseExport(ABC):
         return cls.annotate_and_retrieve_fields(model_queryset, computed_fields, related_table_fields, **kwargs)
 
     @classmethod
-    def get_model_annotation_dict(cls, **kwargs):
-        return convert_queryset_to_dict(cls.get_annotated_queryset(**kwargs), is_model=False)
+    def get_models(cls, **kwargs):
+        """Yields the model dictionaries to write to the csv, in row order.
+        Only one row is kept per id, and rows are streamed from a server-side cursor."""
+        seen_ids = set()
+        for model in cls.get_annotated_queryset(**kwargs).iterator(chunk_size=EXPORT_ITERATOR_CHUNK_SIZE):
+            model_id = model["id"]
+            if model_id not in seen_ids:
+                seen_ids.add(model_id)
+                yield model
 
     @classmethod
     def write_csv(
         cls,
         writer,
         columns,
-        models_dict,
+        models,
         should_write_header=True,
+        return_rows=False,
+        chunk_size=DEFAULT_CSV_CHUNK_SIZE,
+        flush=None,
     ):
         """Receives params from the parent methods and outputs a CSV with filtered and sorted objects.
-        Works with write_header as long as the same writer object is passed."""
+        Works with write_header as long as the same writer object is passed.
 
-        rows = []
-        for object in models_dict.values():
-            try:
-                row = cls.parse_row(columns, object)
-                rows.append(row)
-            except ValueError as err:
-                logger.error(f"csv_export -> Error when parsing row: {err}")
-                continue
+        Rows are parsed lazily and handed to the writer chunk_size rows at a time, calling
+        flush (if given) after each chunk. The full set of rows is only held in memory
+        when return_rows is True."""
 
         if should_write_header:
             write_header(writer, columns)
 
-        writer.writerows(rows)
+        rows = cls.parse_rows(columns, models)
+        if return_rows:
+            rows = list(rows)
+
+        remaining_rows = iter(rows)
+        while chunk := list(islice(remaining_rows, chunk_size)):
+            writer.writerows(chunk)
+            if flush:
+                flush()
 
         # Return rows for easier parsing and testing
-        return rows
+        return rows if return_rows else None
+
+    @classmethod
+    def parse_rows(cls, columns, models):
+        """Yields a parsed row for each model, skipping (and logging) any that fail to parse."""
+        # Columns are fixed for the whole export, so resolve them to model keys once.
+        # parse_row is bound once as well, rather than looked up on the class per row.
+        row_keys = cls.get_row_keys(columns)
+        parse_row = cls.parse_row
+        for object in models:
+            try:
+                yield parse_row(columns, object, row_keys)
+            except ValueError as err:
+                logger.error(f"csv_export -> Error when parsing row: {err}")
+                continue
+
+    @classmethod
+    def get_row_keys(cls, columns):
+        """Returns the model dictionary key for each column, in column order."""
+        fields = cls.FIELDS
+        return [fields.get(column) for column in columns]
 
     @classmethod
     @abstractmethod
-    def parse_row(cls, columns, model):
+    def parse_row(cls, columns, model, row_keys=None):
         """
         Given a set of columns and a model dictionary, generate a new row from cleaned column data.
+        row_keys, when passed, are the columns already resolved by get_row_keys.
         Must be implemented by subclasses
         """
         pass
@@ -314,16 +463,21 @@ class MemberExport(BaseExport):
         return None
 
     @classmethod
-    def get_model_annotation_dict(cls, request=None, **kwargs):
-        """Combines the permissions and invitation model annotations for
-        the final returned csv export which combines both of these contexts.
-        Returns a dictionary of a union between:
-        - UserPortfolioPermissionModelAnnotation.get_annotated_queryset(portfolio, csv_report=True)
-        - PortfolioInvitationModelAnnotation.get_annotated_queryset(portfolio, csv_report=True)
-        """
+    def get_models(cls, request=None, **kwargs):
+        """Streams the union of permissions and invitations from a server-side cursor,
+        so large portfolios are written without holding every member in memory."""
+        members = cls.get_members_queryset(request)
+        if members is None:
+            return []
+        return members.iterator(chunk_size=EXPORT_ITERATOR_CHUNK_SIZE)
+
+    @classmethod
+    def get_members_queryset(cls, request):
+        """Returns an ordered union of the portfolio's UserPortfolioPermissions and
+        unretrieved PortfolioInvitations, or None if no portfolio is in the session."""
         portfolio = request.session.get("portfolio")
         if not portfolio:
-            return {}
+            return None
 
         # Union the two querysets to combine UserPortfolioPermission + invites.
         # Unions cannot have a col mismatch, so we must clamp what is returned here.
@@ -417,8 +571,14 @@ class MemberExport(BaseExport):
         # Adding a order_by increases output predictability.
         # Doesn't matter as much for normal use, but makes tests easier.
         # We should also just be ordering by default anyway.
-        members = permissions.union(invitations).order_by("email_display", "member_display", "first_name", "last_name")
-        return convert_queryset_to_dict(members, is_model=False)
+        # Permissions and invitations come from different tables (and differ in "type"),
+        # so UNION ALL skips the dedupe pass a plain UNION would make postgres do.
+        # The ordering is left to postgres rather than merging two sorted querysets in python:
+        # its collation and NULL placement (invitations have no first/last name) do not match
+        # python's comparisons, and a test transaction is not visible to other connections.
+        return permissions.union(invitations, all=True).order_by(
+            "email_display", "member_display", "first_name", "last_name"
+        )
 
     @classmethod
     def get_invited_by_query(cls, object_id_query):
@@ -472,6 +632,20 @@ class MemberExport(BaseExport):
             output_field=CharField(),
         )
 
+    # Column name -> key in the model dictionary. Derived values are added to the dictionary by parse_row.
+    FIELDS = {
+        "Email": "email_display",
+        "Organization admin": "organization_admin",
+        "Invited by": "invited_by",
+        "Joined date": "joined_date",
+        "Last active": "last_active",
+        "Domain requests": "domain_request_permission_display",
+        "Member management": "member_permission_display",
+        "Domain management": "domain_management",
+        "Number of domains": "number_of_domains",
+        "Domains": "domains",
+    }
+
     @classmethod
     def get_columns(cls):
         """
@@ -490,30 +664,49 @@ class MemberExport(BaseExport):
             "Domains",
         ]
 
+    # Members share a handful of role/permission combinations, so their displays
+    # are computed once per combination instead of once per row.
+    _permission_displays = {}
+
+    @classmethod
+    def get_permission_displays(cls, roles, permissions):
+        """Returns the organization admin flag and the domain request and member
+        permission displays for the given roles and additional permissions."""
+        key = (tuple(roles or ()), tuple(permissions or ()))
+        displays = cls._permission_displays.get(key)
+        if displays is None:
+            displays = (
+                UserPortfolioRoleChoices.ORGANIZATION_ADMIN in key[0],
+                UserPortfolioPermission.get_domain_request_permission_display(roles, permissions),
+                UserPortfolioPermission.get_member_permission_display(roles, permissions),
+            )
+            cls._permission_displays[key] = displays
+        return displays
+
     @classmethod
     @abstractmethod
-    def parse_row(cls, columns, model):
+    def parse_row(cls, columns, model, row_keys=None):
         """
         Given a set of columns and a model dictionary, generate a new row from cleaned column data.
         Must be implemented by subclasses
         """
-        roles = model.get("roles", [])
+        roles = model.get("roles") or ()
         permissions = model.get("additional_permissions_display")
-        user_managed_domains = model.get("domain_info", [])
+        user_managed_domains = model.get("domain_info") or ()
         length_user_managed_domains = len(user_managed_domains)
-        FIELDS = {
-            "Email": model.get("email_display"),
-            "Organization admin": bool(UserPortfolioRoleChoices.ORGANIZATION_ADMIN in roles),
-            "Invited by": model.get("invited_by"),
-            "Joined date": model.get("joined_date"),
-            "Last active": model.get("last_active"),
-            "Domain requests": UserPortfolioPermission.get_domain_request_permission_display(roles, permissions),
-            "Member management": UserPortfolioPermission.get_member_permission_display(roles, permissions),
-            "Domain management": bool(length_user_managed_domains > 0),
-            "Number of domains": length_user_managed_domains,
-            "Domains": ",".join(user_managed_domains),
-        }
-        return [FIELDS.get(column, "") for column in columns]
+
+        (
+            model["organization_admin"],
+            model["domain_request_permission_display"],
+            model["member_permission_display"],
+        ) = cls.get_permission_displays(roles, permissions)
+        model["domain_management"] = bool(length_user_managed_domains > 0)
+        model["number_of_domains"] = length_user_managed_domains
+        model["domains"] = ",".join(user_managed_domains)
+
+        if row_keys is None:
+            row_keys = cls.get_row_keys(columns)
+        return [model.get(key, "") for key in row_keys]
 
 
 class DomainExport(BaseExport):
@@ -523,6 +716,31 @@ class DomainExport(BaseExport):
     Second class in an inheritance tree of 3.
     """
 
+    # Maps each column to the key of the model dictionary that holds its (cleaned) value.
+    # NOTE - DomainDataFull and DomainDataFederal override this temporarily.
+    # We are running into a problem where DomainDataFull and DomainDataFederal are
+    # pulling the wrong data.
+    # For example, the portfolio name, rather than the suborganization name.
+    # This can be removed after that gets fixed.
+    FIELDS = {
+        "Domain name": "domain__name",
+        "Status": "status",
+        "First ready on": "first_ready_on",
+        "Expiration date": "expiration_date",
+        "Domain type": "domain_type",
+        "Agency": "converted_federal_agency",
+        "Organization name": "converted_organization_name",
+        "City": "city",
+        "State": "state_territory",
+        "SO": "converted_so_name",
+        "SO email": "converted_so_email",
+        "Security contact email": "security_contact_email",
+        "Created at": "domain__created_at",
+        "Deleted": "domain__deleted",
+        "Domain managers": "managers",
+        "Invited domain managers": "invited_users",
+    }
+
     @classmethod
     def model(cls):
         # Return the model class that this export handles
@@ -635,86 +853,92 @@ class DomainExport(BaseExport):
             ),
         }
 
-    @classmethod
-    def update_queryset(cls, queryset, **kwargs):
-        """
-        Returns an updated queryset.
-
-        Add security_contact_email, invited_users, and managers to the queryset,
-        based on public_contacts, domain_invitations and user_domain_roles
-        passed through kwargs.
-        """
-        public_contacts = kwargs.get("public_contacts", {})
-        domain_invitations = kwargs.get("domain_invitations", {})
-        user_domain_roles = kwargs.get("user_domain_roles", {})
-
-        annotated_domain_infos = []
-
-        # Create mapping of domain to a list of invited users and managers
-        invited_users_dict = defaultdict(list)
-        for domain, email in domain_invitations:
-            invited_users_dict[domain].append(email)
-
-        managers_dict = defaultdict(list)
-        for domain, email in user_domain_roles:
-            managers_dict[domain].append(email)
-
-        # Annotate with security_contact from public_contacts, invited users
-        # from domain_invitations, and managers from user_domain_roles
-        for domain_info in queryset:
-            domain_info["security_contact_email"] = public_contacts.get(
-                domain_info.get("domain__security_contact_registry_id")
-            )
-            domain_info["invited_users"] = ", ".join(invited_users_dict.get(domain_info.get("domain__name"), []))
-            domain_info["managers"] = ", ".join(managers_dict.get(domain_info.get("domain__name"), []))
-            annotated_domain_infos.append(domain_info)
-
-        if annotated_domain_infos:
-            return annotated_domain_infos
-
-        return queryset
-
     # ============================================================= #
     # Helper functions for django ORM queries.                      #
     # We are using these rather than pure python for speed reasons. #
     # ============================================================= #
 
     @classmethod
-    def get_all_security_emails(cls):
+    def get_security_contact_email_query(cls):
         """
-        Fetch all PublicContact entries and return a mapping of registry_id to email.
+        Returns a subquery for the email of the PublicContact matching the domain's
+        security_contact_registry_id, so it is fetched with the main query.
         """
-        public_contacts = PublicContact.objects.values_list("registry_id", "email")
-        return {registry_id: email for registry_id, email in public_contacts}
+        return Subquery(
+            PublicContact.objects.filter(registry_id=OuterRef("domain__security_contact_registry_id"))
+            .order_by("-id")
+            .values("email")[:1],
+            output_field=CharField(),
+        )
 
     @classmethod
-    def get_all_domain_invitations(cls):
+    def get_invited_users_query(cls, delimiter=", "):
         """
-        Fetch all DomainInvitation entries and return a mapping of domain to email.
+        Returns a subquery joining the emails of pending DomainInvitations on the domain.
         """
-        domain_invitations = DomainInvitation.objects.filter(status="invited").values_list("domain__name", "email")
-        return list(domain_invitations)
+        return Coalesce(
+            Subquery(
+                DomainInvitation.objects.filter(
+                    domain=OuterRef("domain"),
+                    status=DomainInvitation.DomainInvitationStatus.INVITED,
+                )
+                .values("domain")
+                .annotate(emails=StringAgg("email", delimiter=delimiter, ordering="email"))
+                .values("emails")
+            ),
+            Value(""),
+            output_field=CharField(),
+        )
 
     @classmethod
-    def get_all_user_domain_roles(cls):
+    def get_managers_query(cls, delimiter=", "):
         """
-        Fetch all UserDomainRole entries and return a mapping of domain to user__email.
+        Returns a subquery joining the emails of users with a UserDomainRole on the domain.
         """
-        user_domain_roles = (
-            UserDomainRole.objects.select_related("user")
-            .order_by("domain__name", "user__email")
-            .values_list("domain__name", "user__email")
+        return Coalesce(
+            Subquery(
+                UserDomainRole.objects.filter(domain=OuterRef("domain"))
+                .values("domain")
+                .annotate(emails=StringAgg("user__email", delimiter=delimiter, ordering="user__email"))
+                .values("emails")
+            ),
+            Value(""),
+            output_field=CharField(),
         )
-        return list(user_domain_roles)
+
+    # Domain types only depend on the org type and federal type, so their labels
+    # are composed once per pair instead of once per row.
+    _domain_types = {}
+
+    @classmethod
+    def get_domain_type(cls, domain_org_type, domain_federal_type):
+        """Returns the readable domain type, including the federal type for federal domains."""
+        key = (domain_org_type, domain_federal_type)
+        if key not in cls._domain_types:
+            # organization_type has organization_type AND is_election
+            # domain_org_type includes "- Election" org_type variants
+            human_readable_domain_org_type = get_label(
+                ORGANIZATION_ELECTION_OFFICE_LABELS,
+                domain_org_type,
+                DomainRequest.OrgChoicesElectionOffice.get_org_label,
+            )
+            human_readable_domain_federal_type = get_label(
+                BRANCH_LABELS, domain_federal_type, BranchChoices.get_branch_label
+            )
+            domain_type = human_readable_domain_org_type
+            if domain_federal_type and domain_org_type == DomainRequest.OrgChoicesElectionOffice.FEDERAL:
+                domain_type = f"{human_readable_domain_org_type} - {human_readable_domain_federal_type}"
+            cls._domain_types[key] = domain_type
+        return cls._domain_types[key]
 
     @classmethod
-    def parse_row(cls, columns, model):
+    def parse_row(cls, columns, model, row_keys=None):
         """
         Given a set of columns and a model dictionary, generate a new row from cleaned column data.
         """
 
         status = model.get("domain__state")
-        human_readable_status = Domain.State.get_state_label(status)
+        human_readable_status = get_label(DOMAIN_STATE_LABELS, status, Domain.State.get_state_label)
 
         expiration_date = model.get("domain__expiration_date")
         if expiration_date is None:
@@ -724,22 +948,13 @@ class DomainExport(BaseExport):
         if first_ready_on is None:
             first_ready_on = "(blank)"
 
-        # organization_type has organization_type AND is_election
-        # domain_org_type includes "- Election" org_type variants
-        domain_org_type = model.get("converted_org_type")
-        human_readable_domain_org_type = DomainRequest.OrgChoicesElectionOffice.get_org_label(domain_org_type)
-        domain_federal_type = model.get("converted_federal_type")
-        human_readable_domain_federal_type = BranchChoices.get_branch_label(domain_federal_type)
-        domain_type = human_readable_domain_org_type
-        if domain_federal_type and domain_org_type == DomainRequest.OrgChoicesElectionOffice.FEDERAL:
-            domain_type = f"{human_readable_domain_org_type} - {human_readable_domain_federal_type}"
+        domain_type = cls.get_domain_type(model.get("converted_org_type"), model.get("converted_federal_type"))
 
         security_contact_email = model.get("security_contact_email")
-        invalid_emails = {DefaultEmail.LEGACY_DEFAULT.value, DefaultEmail.PUBLIC_CONTACT_DEFAULT.value}
         if (
             not security_contact_email
             or not isinstance(security_contact_email, str)
-            or security_contact_email.lower().strip() in invalid_emails
+            or security_contact_email.lower().strip() in INVALID_SECURITY_CONTACT_EMAILS
         ):
             security_contact_email = "(blank)"
 
@@ -748,119 +963,76 @@ class DomainExport(BaseExport):
         model["expiration_date"] = expiration_date
         model["domain_type"] = domain_type
         model["security_contact_email"] = security_contact_email
-        # create a dictionary of fields which can be included in output.
-        # "extra_fields" are precomputed fields (generated in the DB or parsed).
-        FIELDS = cls.get_fields(model)
 
-        row = [FIELDS.get(column, "") for column in columns]
+        # row_keys maps each column to its key in the model dictionary (see FIELDS),
+        # which holds both precomputed fields (generated in the DB) and parsed fields.
+        if row_keys is None:
+            row_keys = cls.get_row_keys(columns)
+        row = [model.get(key, "") for key in row_keys]
 
         return row
 
-    # NOTE - this override is temporary.
-    # We are running into a problem where DomainDataFull and DomainDataFederal are
-    # pulling the wrong data.
-    # For example, the portfolio name, rather than the suborganization name.
-    # This can be removed after that gets fixed.
-    @classmethod
-    def get_fields(cls, model):
-        FIELDS = {
-            "Domain name": model.get("domain__name"),
-            "Status": model.get("status"),
-            "First ready on": model.get("first_ready_on"),
-            "Expiration date": model.get("expiration_date"),
-            "Domain type": model.get("domain_type"),
-            "Agency": model.get("converted_federal_agency"),
-            "Organization name": model.get("converted_organization_name"),
-            "City": model.get("city"),
-            "State": model.get("state_territory"),
-            "SO": model.get("converted_so_name"),
-            "SO email": model.get("converted_so_email"),
-            "Security contact email": model.get("security_contact_email"),
-            "Created at": model.get("domain__created_at"),
-            "Deleted": model.get("domain__deleted"),
-            "Domain managers": model.get("managers"),
-            "Invited domain managers": model.get("invited_users"),
-        }
-        return FIELDS
-
-    def get_filtered_domain_infos_by_org(domain_infos_to_filter, org_to_filter_by):
-        """Returns a list of Domain Requests that has been filtered by the given organization value."""
-
-        annotated_queryset = domain_infos_to_filter.annotate(
-            converted_generic_org_type=Case(
-                # Recreate the logic of the converted_generic_org_type property
-                # here in annotations
-                When(portfolio__isnull=False, then=F("portfolio__organization_type")),
-                default=F("generic_org_type"),
-                output_field=CharField(),
-            )
+    def get_converted_generic_org_type_query():
+        """Returns an expression for the generic org type, preferring the portfolio's organization type."""
+        # Recreate the logic of the converted_generic_org_type property here in annotations
+        return Case(
+            When(portfolio__isnull=False, then=F("portfolio__organization_type")),
+            default=F("generic_org_type"),
+            output_field=CharField(),
         )
-        return annotated_queryset.filter(converted_generic_org_type=org_to_filter_by)
 
     @classmethod
     def get_sliced_domains(cls, filter_condition):
         """Get filtered domains counts sliced by org type and election office.
-        Pass distinct=True when filtering by permissions so we do not to count multiples
-        when a domain has more that one manager.
+        Counts are only distinct when filtering by permissions, so we do not count multiples
+        when a domain has more than one manager.
         """
+        return cls.get_sliced_domains_by_conditions(filter_condition, [{}])[0]
 
-        domain_informations = DomainInformation.objects.all().filter(**filter_condition).distinct()
-        domains_count = domain_informations.count()
-        federal = (
-            cls.get_filtered_domain_infos_by_org(domain_informations, DomainRequest.OrganizationChoices.FEDERAL)
-            .distinct()
-            .count()
+    @classmethod
+    def get_sliced_domains_by_conditions(cls, filter_condition, slice_conditions):
+        """Like get_sliced_domains, but counts the filtered domains once for each dict of lookups
+        in slice_conditions ({} counts them all), in a single aggregate query.
+        Returns a list of counts per slice condition.
+        """
+        domain_informations = DomainInformation.objects.filter(**filter_condition).annotate(
+            converted_generic_org_type=cls.get_converted_generic_org_type_query()
         )
-        interstate = cls.get_filtered_domain_infos_by_org(
-            domain_informations, DomainRequest.OrganizationChoices.INTERSTATE
-        ).count()
-        state_or_territory = (
-            cls.get_filtered_domain_infos_by_org(
-                domain_informations, DomainRequest.OrganizationChoices.STATE_OR_TERRITORY
+        # Other filters only follow forward relations, which cannot repeat a DomainInformation
+        distinct = any(lookup.startswith("domain__permissions") for lookup in filter_condition)
+
+        org_types = [
+            DomainRequest.OrganizationChoices.FEDERAL,
+            DomainRequest.OrganizationChoices.INTERSTATE,
+            DomainRequest.OrganizationChoices.STATE_OR_TERRITORY,
+            DomainRequest.OrganizationChoices.TRIBAL,
+            DomainRequest.OrganizationChoices.COUNTY,
+            DomainRequest.OrganizationChoices.CITY,
+            DomainRequest.OrganizationChoices.SPECIAL_DISTRICT,
+            DomainRequest.OrganizationChoices.SCHOOL_DISTRICT,
+        ]
+        aggregates = {}
+        for index, lookups in enumerate(slice_conditions):
+            aggregates[f"domains_count_{index}"] = Count(
+                "id", distinct=distinct, filter=Q(**lookups) if lookups else None
             )
-            .distinct()
-            .count()
-        )
-        tribal = (
-            cls.get_filtered_domain_infos_by_org(domain_informations, DomainRequest.OrganizationChoices.TRIBAL)
-            .distinct()
-            .count()
-        )
-        county = (
-            cls.get_filtered_domain_infos_by_org(domain_informations, DomainRequest.OrganizationChoices.COUNTY)
-            .distinct()
-            .count()
-        )
-        city = (
-            cls.get_filtered_domain_infos_by_org(domain_informations, DomainRequest.OrganizationChoices.CITY)
-            .distinct()
-            .count()
-        )
-        special_district = (
-            cls.get_filtered_domain_infos_by_org(
-                domain_informations, DomainRequest.OrganizationChoices.SPECIAL_DISTRICT
+            # Suffixed so aliases like "city" do not clash with DomainInformation fields
+            for org_type in org_types:
+                aggregates[f"{org_type}_count_{index}"] = Count(
+                    "id", distinct=distinct, filter=Q(converted_generic_org_type=org_type, **lookups)
+                )
+            aggregates[f"election_board_{index}"] = Count(
+                "id", distinct=distinct, filter=Q(is_election_board=True, **lookups)
             )
-            .distinct()
-            .count()
-        )
-        school_district = (
-            cls.get_filtered_domain_infos_by_org(domain_informations, DomainRequest.OrganizationChoices.SCHOOL_DISTRICT)
-            .distinct()
-            .count()
-        )
-        election_board = domain_informations.filter(is_election_board=True).distinct().count()
+        counts = domain_informations.aggregate(**aggregates)
 
         return [
-            domains_count,
-            federal,
-            interstate,
-            state_or_territory,
-            tribal,
-            county,
-            city,
-            special_district,
-            school_district,
-            election_board,
+            [
+                counts[f"domains_count_{index}"],
+                *[counts[f"{org_type}_count_{index}"] for org_type in org_types],
+                counts[f"election_board_{index}"],
+            ]
+            for index in range(len(slice_conditions))
         ]
 
 
@@ -893,6 +1065,18 @@ class DomainDataType(DomainExport):
             "Invited domain managers",
         ]
 
+    @classmethod
+    def get_computed_fields(cls, **kwargs):
+        """
+        Get a dict of computed fields, including the security contact email,
+        domain managers and invited domain managers.
+        """
+        computed_fields = super().get_computed_fields(**kwargs)
+        computed_fields["security_contact_email"] = cls.get_security_contact_email_query()
+        computed_fields["managers"] = cls.get_managers_query()
+        computed_fields["invited_users"] = cls.get_invited_users_query()
+        return computed_fields
+
     @classmethod
     def get_annotations_for_sort(cls):
         """
@@ -913,29 +1097,6 @@ class DomainDataType(DomainExport):
             "domain__name",
         ]
 
-    @classmethod
-    def get_additional_args(cls):
-        """
-        Returns additional keyword arguments specific to DomainExport.
-
-        Returns:
-            dict: Dictionary containing public_contacts, domain_invitations, and user_domain_roles.
-        """
-        # Fetch all relevant PublicContact entries
-        public_contacts = cls.get_all_security_emails()
-
-        # Fetch all relevant Invite entries
-        domain_invitations = cls.get_all_domain_invitations()
-
-        # Fetch all relevant UserDomainRole entries
-        user_domain_roles = cls.get_all_user_domain_roles()
-
-        return {
-            "public_contacts": public_contacts,
-            "domain_invitations": domain_invitations,
-            "user_domain_roles": user_domain_roles,
-        }
-
     @classmethod
     def get_select_related(cls):
         """
@@ -943,13 +1104,6 @@ class DomainDataType(DomainExport):
         """
         return ["domain", "senior_official"]
 
-    @classmethod
-    def get_prefetch_related(cls):
-        """
-        Get a list of tables to pass to prefetch_related when building queryset.
-        """
-        return ["domain__permissions"]
-
     @classmethod
     def get_related_table_fields(cls):
         """
@@ -1003,27 +1157,15 @@ class DomainDataFull(DomainExport):
     # converted_state_territory => state_territory
     # converted_so_name => so_name
     # converted_so_email => senior_official__email
-    @classmethod
-    def get_fields(cls, model):
-        FIELDS = {
-            "Domain name": model.get("domain__name"),
-            "Status": model.get("status"),
-            "First ready on": model.get("first_ready_on"),
-            "Expiration date": model.get("expiration_date"),
-            "Domain type": model.get("domain_type"),
-            "Agency": model.get("federal_agency__agency"),
-            "Organization name": model.get("organization_name"),
-            "City": model.get("city"),
-            "State": model.get("state_territory"),
-            "SO": model.get("so_name"),
-            "SO email": model.get("senior_official__email"),
-            "Security contact email": model.get("security_contact_email"),
-            "Created at": model.get("domain__created_at"),
-            "Deleted": model.get("domain__deleted"),
-            "Domain managers": model.get("managers"),
-            "Invited domain managers": model.get("invited_users"),
-        }
-        return FIELDS
+    FIELDS = {
+        **DomainExport.FIELDS,
+        "Agency": "federal_agency__agency",
+        "Organization name": "organization_name",
+        "City": "city",
+        "State": "state_territory",
+        "SO": "so_name",
+        "SO email": "senior_official__email",
+    }
 
     @classmethod
     def get_columns(cls):
@@ -1061,19 +1203,13 @@ class DomainDataFull(DomainExport):
         ]
 
     @classmethod
-    def get_additional_args(cls):
+    def get_computed_fields(cls, **kwargs):
         """
-        Returns additional keyword arguments specific to DomainExport.
-
-        Returns:
-            dict: Dictionary containing public_contacts, domain_invitations, and user_domain_roles.
+        Get a dict of computed fields, including the security contact email.
         """
-        # Fetch all relevant PublicContact entries
-        public_contacts = cls.get_all_security_emails()
-
-        return {
-            "public_contacts": public_contacts,
-        }
+        computed_fields = super().get_computed_fields(**kwargs)
+        computed_fields["security_contact_email"] = cls.get_security_contact_email_query()
+        return computed_fields
 
     @classmethod
     def get_select_related(cls):
@@ -1105,6 +1241,14 @@ class DomainDataFull(DomainExport):
             "federal_agency__agency",
         ]
 
+    @classmethod
+    def get_model_fields(cls, include_many_to_many=False):
+        """
+        Only retrieve the DomainInformation fields this export writes,
+        rather than every column and reverse relation.
+        """
+        return ["id", "organization_name", "city", "state_territory"]
+
 
 class DomainDataFederal(DomainExport):
     """
@@ -1123,27 +1267,15 @@ class DomainDataFederal(DomainExport):
     # converted_state_territory => state_territory
     # converted_so_name => so_name
     # converted_so_email => senior_official__email
-    @classmethod
-    def get_fields(cls, model):
-        FIELDS = {
-            "Domain name": model.get("domain__name"),
-            "Status": model.get("status"),
-            "First ready on": model.get("first_ready_on"),
-            "Expiration date": model.get("expiration_date"),
-            "Domain type": model.get("domain_type"),
-            "Agency": model.get("federal_agency__agency"),
-            "Organization name": model.get("organization_name"),
-            "City": model.get("city"),
-            "State": model.get("state_territory"),
-            "SO": model.get("so_name"),
-            "SO email": model.get("senior_official__email"),
-            "Security contact email": model.get("security_contact_email"),
-            "Created at": model.get("domain__created_at"),
-            "Deleted": model.get("domain__deleted"),
-            "Domain managers": model.get("managers"),
-            "Invited domain managers": model.get("invited_users"),
-        }
-        return FIELDS
+    FIELDS = {
+        **DomainExport.FIELDS,
+        "Agency": "federal_agency__agency",
+        "Organization name": "organization_name",
+        "City": "city",
+        "State": "state_territory",
+        "SO": "so_name",
+        "SO email": "senior_official__email",
+    }
 
     @classmethod
     def get_columns(cls):
@@ -1181,19 +1313,13 @@ class DomainDataFederal(DomainExport):
         ]
 
     @classmethod
-    def get_additional_args(cls):
+    def get_computed_fields(cls, **kwargs):
         """
-        Returns additional keyword arguments specific to DomainExport.
-
-        Returns:
-            dict: Dictionary containing public_contacts, domain_invitations, and user_domain_roles.
+        Get a dict of computed fields, including the security contact email.
         """
-        # Fetch all relevant PublicContact entries
-        public_contacts = cls.get_all_security_emails()
-
-        return {
-            "public_contacts": public_contacts,
-        }
+        computed_fields = super().get_computed_fields(**kwargs)
+        computed_fields["security_contact_email"] = cls.get_security_contact_email_query()
+        return computed_fields
 
     @classmethod
     def get_select_related(cls):
@@ -1226,6 +1352,14 @@ class DomainDataFederal(DomainExport):
             "federal_agency__agency",
         ]
 
+    @classmethod
+    def get_model_fields(cls, include_many_to_many=False):
+        """
+        Only retrieve the DomainInformation fields this export writes,
+        rather than every column and reverse relation.
+        """
+        return ["id", "organization_name", "city", "state_territory"]
+
 
 class DomainGrowth(DomainExport):
     """
@@ -1294,14 +1428,8 @@ class DomainGrowth(DomainExport):
             # Return nothing
             return Q(id__in=[])
 
-        filter_ready = Q(
-            domain__state__in=[Domain.State.READY],
-            domain__first_ready__gte=start_date,
-            domain__first_ready__lte=end_date,
-        )
-        filter_deleted = Q(
-            domain__state__in=[Domain.State.DELETED], domain__deleted__gte=start_date, domain__deleted__lte=end_date
-        )
+        filter_ready = Q(domain__state=Domain.State.READY, domain__first_ready__range=(start_date, end_date))
+        filter_deleted = Q(domain__state=Domain.State.DELETED, domain__deleted__range=(start_date, end_date))
         return filter_ready | filter_deleted
 
     @classmethod
@@ -1354,13 +1482,6 @@ class DomainManaged(DomainExport):
         """
         return ["domain"]
 
-    @classmethod
-    def get_prefetch_related(cls):
-        """
-        Get a list of tables to pass to prefetch_related when building queryset.
-        """
-        return ["permissions"]
-
     @classmethod
     def get_filter_conditions(cls, end_date=None, **kwargs):
         """
@@ -1377,24 +1498,14 @@ class DomainManaged(DomainExport):
         )
 
     @classmethod
-    def get_additional_args(cls):
+    def get_computed_fields(cls, **kwargs):
         """
-        Returns additional keyword arguments specific to DomainExport.
-
-        Returns:
-            dict: Dictionary containing public_contacts, domain_invitations, and user_domain_roles.
+        Get a dict of computed fields, including domain managers and invited domain managers.
         """
-
-        # Fetch all relevant Invite entries
-        domain_invitations = cls.get_all_domain_invitations()
-
-        # Fetch all relevant UserDomainRole entries
-        user_domain_roles = cls.get_all_user_domain_roles()
-
-        return {
-            "domain_invitations": domain_invitations,
-            "user_domain_roles": user_domain_roles,
-        }
+        computed_fields = super().get_computed_fields(**kwargs)
+        computed_fields["managers"] = cls.get_managers_query()
+        computed_fields["invited_users"] = cls.get_invited_users_query()
+        return computed_fields
 
     @classmethod
     def get_related_table_fields(cls):
@@ -1412,51 +1523,26 @@ class DomainManaged(DomainExport):
         """
         start_date_formatted = format_start_date(start_date)
         end_date_formatted = format_end_date(end_date)
-        filter_managed_domains_start_date = {
+        # Both dates are counted in one query, over the domains ready by the later one
+        filter_managed_domains = {
             "domain__permissions__isnull": False,
-            "domain__first_ready__lte": start_date_formatted,
+            "domain__first_ready__lte": max(start_date_formatted, end_date_formatted),
         }
-        managed_domains_sliced_at_start_date = cls.get_sliced_domains(filter_managed_domains_start_date)
-
-        csv_writer.writerow(["MANAGED DOMAINS COUNTS AT START DATE"])
-        csv_writer.writerow(
+        managed_domains_sliced_at_start_date, managed_domains_sliced_at_end_date = cls.get_sliced_domains_by_conditions(
+            filter_managed_domains,
             [
-                "Total",
-                "Federal",
-                "Interstate",
-                "State or territory",
-                "Tribal",
-                "County",
-                "City",
-                "Special district",
-                "School district",
-                "Election office",
-            ]
+                {"domain__first_ready__lte": start_date_formatted},
+                {"domain__first_ready__lte": end_date_formatted},
+            ],
         )
+
+        csv_writer.writerow(["MANAGED DOMAINS COUNTS AT START DATE"])
+        csv_writer.writerow(SLICED_COUNTS_HEADER)
         csv_writer.writerow(managed_domains_sliced_at_start_date)
         csv_writer.writerow([])
 
-        filter_managed_domains_end_date = {
-            "domain__permissions__isnull": False,
-            "domain__first_ready__lte": end_date_formatted,
-        }
-        managed_domains_sliced_at_end_date = cls.get_sliced_domains(filter_managed_domains_end_date)
-
         csv_writer.writerow(["MANAGED DOMAINS COUNTS AT END DATE"])
-        csv_writer.writerow(
-            [
-                "Total",
-                "Federal",
-                "Interstate",
-                "State or territory",
-                "Tribal",
-                "County",
-                "City",
-                "Special district",
-                "School district",
-                "Election office",
-            ]
-        )
+        csv_writer.writerow(SLICED_COUNTS_HEADER)
         csv_writer.writerow(managed_domains_sliced_at_end_date)
         csv_writer.writerow([])
 
@@ -1493,13 +1579,6 @@ class DomainUnmanaged(DomainExport):
         """
         return ["domain"]
 
-    @classmethod
-    def get_prefetch_related(cls):
-        """
-        Get a list of tables to pass to prefetch_related when building queryset.
-        """
-        return ["permissions"]
-
     @classmethod
     def get_filter_conditions(cls, end_date=None, **kwargs):
         """
@@ -1532,55 +1611,78 @@ class DomainUnmanaged(DomainExport):
         """
         start_date_formatted = format_start_date(start_date)
         end_date_formatted = format_end_date(end_date)
-        filter_unmanaged_domains_start_date = {
+        # Both dates are counted in one query, over the domains ready by the later one
+        filter_unmanaged_domains = {
             "domain__permissions__isnull": True,
-            "domain__first_ready__lte": start_date_formatted,
+            "domain__first_ready__lte": max(start_date_formatted, end_date_formatted),
         }
-        unmanaged_domains_sliced_at_start_date = cls.get_sliced_domains(filter_unmanaged_domains_start_date)
+        unmanaged_domains_sliced_at_start_date, unmanaged_domains_sliced_at_end_date = (
+            cls.get_sliced_domains_by_conditions(
+                filter_unmanaged_domains,
+                [
+                    {"domain__first_ready__lte": start_date_formatted},
+                    {"domain__first_ready__lte": end_date_formatted},
+                ],
+            )
+        )
 
         csv_writer.writerow(["UNMANAGED DOMAINS AT START DATE"])
-        csv_writer.writerow(
-            [
-                "Total",
-                "Federal",
-                "Interstate",
-                "State or territory",
-                "Tribal",
-                "County",
-                "City",
-                "Special district",
-                "School district",
-                "Election office",
-            ]
-        )
+        csv_writer.writerow(SLICED_COUNTS_HEADER)
         csv_writer.writerow(unmanaged_domains_sliced_at_start_date)
         csv_writer.writerow([])
 
-        filter_unmanaged_domains_end_date = {
-            "domain__permissions__isnull": True,
-            "domain__first_ready__lte": end_date_formatted,
-        }
-        unmanaged_domains_sliced_at_end_date = cls.get_sliced_domains(filter_unmanaged_domains_end_date)
-
         csv_writer.writerow(["UNMANAGED DOMAINS AT END DATE"])
-        csv_writer.writerow(
-            [
-                "Total",
-                "Federal",
-                "Interstate",
-                "State or territory",
-                "Tribal",
-                "County",
-                "City",
-                "Special district",
-                "School district",
-                "Election office",
-            ]
-        )
+        csv_writer.writerow(SLICED_COUNTS_HEADER)
         csv_writer.writerow(unmanaged_domains_sliced_at_end_date)
         csv_writer.writerow([])
 
 
+def parse_requested_domain_name(model):
+    """Returns the requested domain, with a default if there is none."""
+    return model.get("requested_domain__name") or "No requested domain"
+
+
+def parse_request_status(model):
+    """Returns the readable status. The stored value is the wrong format."""
+    return get_label(
+        DOMAIN_REQUEST_STATUS_LABELS, model.get("status"), DomainRequest.DomainRequestStatus.get_status_label
+    )
+
+
+def parse_request_election_board(model):
+    """Returns N/A if is_election_board is None, "Yes"/"No" if boolean."""
+    is_election_board = model.get("is_election_board")
+    if is_election_board is None:
+        return "N/A"
+    return "Yes" if is_election_board else "No"
+
+
+def parse_request_federal_type(model):
+    """Returns the readable federal type. The stored value is the wrong format."""
+    return get_label(BRANCH_LABELS, model.get("converted_federal_type"), BranchChoices.get_branch_label)
+
+
+def parse_request_org_type(model):
+    """Returns the readable generic org type."""
+    return get_label(
+        ORGANIZATION_LABELS, model.get("converted_generic_org_type"), DomainRequest.OrganizationChoices.get_org_label
+    )
+
+
+def parse_request_additional_details(model):
+    """Returns the CISA representative and anything else fields, pipe seperated."""
+    cisa_rep_first = model.get("cisa_representative_first_name")
+    cisa_rep_last = model.get("cisa_representative_last_name")
+    cisa_rep = (
+        f"{cisa_rep_first} {cisa_rep_last}" if cisa_rep_first and cisa_rep_last else cisa_rep_first or cisa_rep_last
+    )
+
+    anything_else = model.get("anything_else")
+    if cisa_rep and anything_else:
+        return f"{cisa_rep} | {anything_else}"
+    return cisa_rep or anything_else or ""
+
+
 class DomainRequestExport(BaseExport):
     """
     A collection of functions which return csv files regarding the DomainRequest model.
@@ -1592,28 +1694,29 @@ class DomainRequestExport(BaseExport):
         # Return the model class that this export handles
         return DomainRequest
 
-    def get_filtered_domain_requests_by_org(domain_requests_to_filter, org_to_filter_by):
-        """Returns a list of Domain Requests that has been filtered by the given organization value"""
-        annotated_queryset = domain_requests_to_filter.annotate(
-            converted_generic_org_type=Case(
-                # Recreate the logic of the converted_generic_org_type property
-                # here in annotations
-                When(portfolio__isnull=False, then=F("portfolio__organization_type")),
-                default=F("generic_org_type"),
-                output_field=CharField(),
-            )
+    def get_converted_generic_org_type_query():
+        """Returns an expression for the generic org type, preferring the portfolio's organization type."""
+        # Recreate the logic of the converted_generic_org_type property here in annotations
+        return Case(
+            When(portfolio__isnull=False, then=F("portfolio__organization_type")),
+            default=F("generic_org_type"),
+            output_field=CharField(),
         )
-        return annotated_queryset.filter(converted_generic_org_type=org_to_filter_by)
 
-        # return domain_requests_to_filter.filter(
-        #     # Filter based on the generic org value returned by converted_generic_org_type
-        #     id__in=[
-        #         domainRequest.id
-        #         for domainRequest in domain_requests_to_filter
-        #         if domainRequest.converted_generic_org_type
-        #         and domainRequest.converted_generic_org_type == org_to_filter_by
-        #     ]
-        # )
+    @classmethod
+    def get_region_query(cls):
+        """
+        Returns an expression for the CISA region of the request's state/territory.
+        Recreates the get_region template filter in SQL: no region without a state/territory,
+        and N/A for one that isn't mapped to a region.
+        """
+        return Case(
+            When(Q(state_territory__isnull=True) | Q(state_territory=""), then=None),
+            # get_region uppercases the state/territory before the lookup, so match regardless of case
+            *[When(state_territory__iexact=state, then=Value(str(region))) for state, region in REGIONS.items()],
+            default=Value("N/A"),
+            output_field=CharField(),
+        )
 
     @classmethod
     def get_computed_fields(cls, delimiter=", ", **kwargs):
@@ -1708,147 +1811,138 @@ class DomainRequestExport(BaseExport):
                 ),
                 output_field=CharField(),
             ),
+            "region": cls.get_region_query(),
         }
 
     @classmethod
     def get_sliced_requests(cls, filter_condition):
-        """Get filtered requests counts sliced by org type and election office."""
-        requests = DomainRequest.objects.all().filter(**filter_condition).distinct()
-        requests_count = requests.count()
-        federal = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.FEDERAL)
-            .distinct()
-            .count()
-        )
-        interstate = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.INTERSTATE)
-            .distinct()
-            .count()
-        )
-        state_or_territory = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.STATE_OR_TERRITORY)
-            .distinct()
-            .count()
-        )
-        tribal = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.TRIBAL)
-            .distinct()
-            .count()
-        )
-        county = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.COUNTY)
-            .distinct()
-            .count()
-        )
-        city = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.CITY).distinct().count()
-        )
-        special_district = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.SPECIAL_DISTRICT)
-            .distinct()
-            .count()
+        """Get filtered requests counts sliced by org type and election office.
+        Filters only span forward relations, so each request is counted once without DISTINCT.
+        """
+        requests = DomainRequest.objects.filter(**filter_condition).annotate(
+            converted_generic_org_type=cls.get_converted_generic_org_type_query()
         )
-        school_district = (
-            cls.get_filtered_domain_requests_by_org(requests, DomainRequest.OrganizationChoices.SCHOOL_DISTRICT)
-            .distinct()
-            .count()
+
+        # Count every slice in a single aggregate query
+        org_types = [
+            DomainRequest.OrganizationChoices.FEDERAL,
+            DomainRequest.OrganizationChoices.INTERSTATE,
+            DomainRequest.OrganizationChoices.STATE_OR_TERRITORY,
+            DomainRequest.OrganizationChoices.TRIBAL,
+            DomainRequest.OrganizationChoices.COUNTY,
+            DomainRequest.OrganizationChoices.CITY,
+            DomainRequest.OrganizationChoices.SPECIAL_DISTRICT,
+            DomainRequest.OrganizationChoices.SCHOOL_DISTRICT,
+        ]
+        counts = requests.aggregate(
+            requests_count=Count("id"),
+            # Suffixed so aliases like "city" do not clash with DomainRequest fields
+            **{
+                f"{org_type}_count": Count("id", filter=Q(converted_generic_org_type=org_type))
+                for org_type in org_types
+            },
+            election_board=Count("id", filter=Q(is_election_board=True)),
         )
-        election_board = requests.filter(is_election_board=True).distinct().count()
 
         return [
-            requests_count,
-            federal,
-            interstate,
-            state_or_territory,
-            tribal,
-            county,
-            city,
-            special_district,
-            school_district,
-            election_board,
+            counts["requests_count"],
+            *[counts[f"{org_type}_count"] for org_type in org_types],
+            counts["election_board"],
+        ]
+
+    # Column name -> key in the model dictionary, or in PARSED_FIELDS for parsed values.
+    FIELDS = {
+        # Parsed fields
+        "Domain request": "requested_domain_name",
+        "Status": "status_display",
+        "Election office": "human_readable_election_board",
+        "Federal type": "human_readable_federal_type",
+        "Domain type": "human_readable_org_type",
+        "Request additional details": "additional_details",
+        # Annotated fields
+        "Region": "region",
+        "Creator approved domains count": "creator_approved_domains_count",
+        "Creator active requests count": "creator_active_requests_count",
+        "Alternative domains": "all_alternative_domains",
+        "Other contacts": "all_other_contacts",
+        "Current websites": "all_current_websites",
+        # Untouched FK fields
+        "Federal agency": "converted_federal_agency",
+        "SO first name": "converted_senior_official_first_name",
+        "SO last name": "converted_senior_official_last_name",
+        "SO email": "converted_so_email",
+        "SO title/role": "converted_senior_official_title",
+        "Creator first name": "creator__first_name",
+        "Creator last name": "creator__last_name",
+        "Creator email": "creator__email",
+        "Investigator": "investigator__email",
+        # Untouched fields
+        "Organization name": "converted_organization_name",
+        "City": "city",
+        "State/territory": "state_territory",
+        "Request purpose": "purpose",
+        "CISA regional representative": "cisa_representative_email",
+        "Last submitted date": "last_submitted_date",
+        "First submitted date": "first_submitted_date",
+        "Last status update": "last_status_update",
+    }
+
+    # Parsed field key -> function deriving its value from the model dictionary
+    PARSED_FIELDS = {
+        "requested_domain_name": parse_requested_domain_name,
+        "status_display": parse_request_status,
+        "human_readable_election_board": parse_request_election_board,
+        "human_readable_federal_type": parse_request_federal_type,
+        "human_readable_org_type": parse_request_org_type,
+        "additional_details": parse_request_additional_details,
+        "creator_approved_domains_count": lambda model: model.get("creator_approved_domains_count", 0),
+        "creator_active_requests_count": lambda model: model.get("creator_active_requests_count", 0),
+    }
+
+    @classmethod
+    def get_model_fields(cls, include_many_to_many=False):
+        """
+        Only retrieve the DomainRequest fields read by FIELDS and PARSED_FIELDS,
+        rather than every column and reverse relation. Related table fields and
+        computed fields are retrieved separately.
+        """
+        return [
+            "id",
+            "status",
+            "is_election_board",
+            "city",
+            "state_territory",
+            "purpose",
+            "anything_else",
+            "cisa_representative_first_name",
+            "cisa_representative_last_name",
+            "cisa_representative_email",
+            "last_submitted_date",
+            "first_submitted_date",
+            "last_status_update",
         ]
 
     @classmethod
-    def parse_row(cls, columns, model):
+    def get_row_keys(cls, columns):
         """
-        Given a set of columns and a model dictionary, generate a new row from cleaned column data.
+        Returns a function reading each column's value from the model dictionary, in column order.
+        Parsed fields use their PARSED_FIELDS function, all other keys are read as is.
         """
+        parsed_fields = cls.PARSED_FIELDS
+        return [parsed_fields.get(key) or methodcaller("get", key, "") for key in super().get_row_keys(columns)]
 
-        # Handle the federal_type field. Defaults to the wrong format.
-        federal_type = model.get("converted_federal_type")
-        human_readable_federal_type = BranchChoices.get_branch_label(federal_type) if federal_type else None
-
-        # Handle the org_type field
-        org_type = model.get("converted_generic_org_type")
-        human_readable_org_type = DomainRequest.OrganizationChoices.get_org_label(org_type) if org_type else None
-
-        # Handle the status field. Defaults to the wrong format.
-        status = model.get("status")
-        status_display = DomainRequest.DomainRequestStatus.get_status_label(status) if status else None
-
-        # Handle the region field.
-        state_territory = model.get("state_territory")
-        region = get_region(state_territory) if state_territory else None
-
-        # Handle the requested_domain field (add a default if None)
-        requested_domain = model.get("requested_domain__name")
-        requested_domain_name = requested_domain if requested_domain else "No requested domain"
-
-        # Handle the election field. N/A if None, "Yes"/"No" if boolean
-        human_readable_election_board = "N/A"
-        is_election_board = model.get("is_election_board")
-        if is_election_board is not None:
-            human_readable_election_board = "Yes" if is_election_board else "No"
-
-        # Handle the additional details field. Pipe seperated.
-        cisa_rep_first = model.get("cisa_representative_first_name")
-        cisa_rep_last = model.get("cisa_representative_last_name")
-        name = [n for n in [cisa_rep_first, cisa_rep_last] if n]
-
-        cisa_rep = " ".join(name) if name else None
-        details = [cisa_rep, model.get("anything_else")]
-        additional_details = " | ".join([field for field in details if field])
-
-        # create a dictionary of fields which can be included in output.
-        # "extra_fields" are precomputed fields (generated in the DB or parsed).
-        FIELDS = {
-            # Parsed fields - defined above.
-            "Domain request": requested_domain_name,
-            "Region": region,
-            "Status": status_display,
-            "Election office": human_readable_election_board,
-            "Federal type": human_readable_federal_type,
-            "Domain type": human_readable_org_type,
-            "Request additional details": additional_details,
-            # Annotated fields - passed into the request dict.
-            "Creator approved domains count": model.get("creator_approved_domains_count", 0),
-            "Creator active requests count": model.get("creator_active_requests_count", 0),
-            "Alternative domains": model.get("all_alternative_domains"),
-            "Other contacts": model.get("all_other_contacts"),
-            "Current websites": model.get("all_current_websites"),
-            # Untouched FK fields - passed into the request dict.
-            "Federal agency": model.get("converted_federal_agency"),
-            "SO first name": model.get("converted_senior_official_first_name"),
-            "SO last name": model.get("converted_senior_official_last_name"),
-            "SO email": model.get("converted_so_email"),
-            "SO title/role": model.get("converted_senior_official_title"),
-            "Creator first name": model.get("creator__first_name"),
-            "Creator last name": model.get("creator__last_name"),
-            "Creator email": model.get("creator__email"),
-            "Investigator": model.get("investigator__email"),
-            # Untouched fields
-            "Organization name": model.get("converted_organization_name"),
-            "City": model.get("city"),
-            "State/territory": model.get("state_territory"),
-            "Request purpose": model.get("purpose"),
-            "CISA regional representative": model.get("cisa_representative_email"),
-            "Last submitted date": model.get("last_submitted_date"),
-            "First submitted date": model.get("first_submitted_date"),
-            "Last status update": model.get("last_status_update"),
-        }
+    @classmethod
+    def parse_row(cls, columns, model, row_keys=None):
+        """
+        Given a set of columns and a model dictionary, generate a new row from cleaned column data.
+        """
 
-        row = [FIELDS.get(column, "") for column in columns]
-        return row
+        # row_keys holds the value reader for each column (see get_row_keys).
+        # Precomputed fields (generated in the DB) are read as is, and parsed fields
+        # are only derived for the columns being written.
+        if row_keys is None:
+            row_keys = cls.get_row_keys(columns)
+        return [read_value(model) for read_value in row_keys]
 
 
 class DomainRequestDataType(DomainRequestExport):
@@ -1911,13 +2005,6 @@ class DomainRequestDataType(DomainRequestExport):
         """
         return ["creator", "senior_official", "federal_agency", "investigator", "requested_domain"]
 
-    @classmethod
-    def get_prefetch_related(cls):
-        """
-        Get a list of tables to pass to prefetch_related when building queryset.
-        """
-        return ["current_websites", "other_contacts", "alternative_domains"]
-
     @classmethod
     def get_related_table_fields(cls):
         """
@@ -1975,10 +2062,7 @@ class DomainRequestGrowth(DomainRequestExport):
 
         start_date_formatted = format_start_date(start_date)
         end_date_formatted = format_end_date(end_date)
-        return Q(
-            last_submitted_date__lte=end_date_formatted,
-            last_submitted_date__gte=start_date_formatted,
-        )
+        return Q(last_submitted_date__range=(start_date_formatted, end_date_formatted))
 
     @classmethod
     def get_related_table_fields(cls):
@@ -2038,13 +2122,6 @@ class DomainRequestDataFull(DomainRequestExport):
         """
         return ["creator", "senior_official", "federal_agency", "investigator", "requested_domain"]
 
-    @classmethod
-    def get_prefetch_related(cls):
-        """
-        Get a list of tables to pass to prefetch_related when building queryset.
-        """
-        return ["current_websites", "other_contacts", "alternative_domains"]
-
     @classmethod
     def get_exclusions(cls):
         """
@@ -2075,21 +2152,23 @@ class DomainRequestDataFull(DomainRequestExport):
             {
                 "creator_approved_domains_count": cls.get_creator_approved_domains_count_query(),
                 "creator_active_requests_count": cls.get_creator_active_requests_count_query(),
-                "all_current_websites": StringAgg("current_websites__website", delimiter=delimiter, distinct=True),
-                "all_alternative_domains": StringAgg(
-                    "alternative_domains__website", delimiter=delimiter, distinct=True
+                "all_current_websites": cls.get_many_to_many_string_agg_query(
+                    "current_websites", "website__website", delimiter
+                ),
+                "all_alternative_domains": cls.get_many_to_many_string_agg_query(
+                    "alternative_domains", "website__website", delimiter
                 ),
                 # Coerce the other contacts object to "{first_name} {last_name} {email}"
-                "all_other_contacts": StringAgg(
+                "all_other_contacts": cls.get_many_to_many_string_agg_query(
+                    "other_contacts",
                     Concat(
-                        "other_contacts__first_name",
+                        "contact__first_name",
                         Value(" "),
-                        "other_contacts__last_name",
+                        "contact__last_name",
                         Value(" "),
-                        "other_contacts__email",
+                        "contact__email",
                     ),
-                    delimiter=delimiter,
-                    distinct=True,
+                    delimiter,
                 ),
             }
         )
@@ -2120,39 +2199,62 @@ class DomainRequestDataFull(DomainRequestExport):
     # ============================================================= #
 
     @classmethod
-    def get_creator_approved_domains_count_query(cls):
+    def get_many_to_many_string_agg_query(cls, field_name, expression, delimiter):
         """
-        Generates a Count query for distinct approved domain requests per creator.
+        Generates a subquery joining the distinct values of expression for a many to many field.
 
-        Returns:
-            Count: Aggregates distinct 'APPROVED' domain requests by creator.
+        Aggregating per request through the field's join table keeps the three many to many
+        fields from multiplying each other's rows in the main query.
+        """
+        through = getattr(DomainRequest, field_name).through
+        return Subquery(
+            through.objects.filter(domainrequest=OuterRef("pk"))
+            .values("domainrequest")
+            .annotate(joined_values=StringAgg(expression, delimiter=delimiter, distinct=True))
+            .values("joined_values"),
+            output_field=TextField(),
+        )
+
+    @classmethod
+    def get_creator_requests_count_query(cls, statuses):
         """
+        Generates a correlated subquery counting the creator's domain requests in the given statuses.
+        Counting in a subquery keeps the creator's other requests out of the outer query's joins.
 
-        query = Count(
-            "creator__domain_requests_created__id",
-            filter=Q(creator__domain_requests_created__status=DomainRequest.DomainRequestStatus.APPROVED),
-            distinct=True,
+        Returns:
+            Coalesce: The number of the creator's domain requests in statuses, or 0.
+        """
+        creator_requests = (
+            DomainRequest.objects.filter(creator=OuterRef("creator"), status__in=statuses)
+            .order_by()
+            .values("creator")
+            .annotate(requests_count=Count("id"))
+            .values("requests_count")
         )
-        return query
+        return Coalesce(Subquery(creator_requests), 0)
 
     @classmethod
-    def get_creator_active_requests_count_query(cls):
+    def get_creator_approved_domains_count_query(cls):
         """
-        Generates a Count query for distinct approved domain requests per creator.
+        Generates a subquery counting approved domain requests per creator.
 
         Returns:
-            Count: Aggregates distinct 'SUBMITTED', 'IN_REVIEW', and 'ACTION_NEEDED' domain requests by creator.
+            Coalesce: Counts 'APPROVED' domain requests by creator.
         """
+        return cls.get_creator_requests_count_query([DomainRequest.DomainRequestStatus.APPROVED])
 
-        query = Count(
-            "creator__domain_requests_created__id",
-            filter=Q(
-                creator__domain_requests_created__status__in=[
-                    DomainRequest.DomainRequestStatus.SUBMITTED,
-                    DomainRequest.DomainRequestStatus.IN_REVIEW,
-                    DomainRequest.DomainRequestStatus.ACTION_NEEDED,
-                ]
-            ),
-            distinct=True,
+    @classmethod
+    def get_creator_active_requests_count_query(cls):
+        """
+        Generates a subquery counting active domain requests per creator.
+
+        Returns:
+            Coalesce: Counts 'SUBMITTED', 'IN_REVIEW', and 'ACTION_NEEDED' domain requests by creator.
+        """
+        return cls.get_creator_requests_count_query(
+            [
+                DomainRequest.DomainRequestStatus.SUBMITTED,
+                DomainRequest.DomainRequestStatus.IN_REVIEW,
+                DomainRequest.DomainRequestStatus.ACTION_NEEDED,
+            ]
         )
-        return query
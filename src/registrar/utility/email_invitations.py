@@ -82,17 +82,17 @@ def check_outside_org_membership(email, requestor, is_member_of_different_org):
 
 def validate_existing_invitation(email, domain):
     """Check for existing invitations and handle their status."""
-    try:
-        invite = DomainInvitation.objects.get(email=email, domain=domain)
-        if invite.status == DomainInvitation.DomainInvitationStatus.RETRIEVED:
-            raise AlreadyDomainManagerError(email)
-        elif invite.status == DomainInvitation.DomainInvitationStatus.CANCELED:
-            invite.update_cancellation_status()
-            invite.save()
-        else:
-            raise AlreadyDomainInvitedError(email)
-    except DomainInvitation.DoesNotExist:
-        pass
+    invite = DomainInvitation.objects.filter(email=email, domain=domain).first()
+    if invite is None:
+        return
+
+    if invite.status == DomainInvitation.DomainInvitationStatus.RETRIEVED:
+        raise AlreadyDomainManagerError(email)
+    elif invite.status == DomainInvitation.DomainInvitationStatus.CANCELED:
+        invite.update_cancellation_status()
+        invite.save()
+    else:
+        raise AlreadyDomainInvitedError(email)
 
 
 def send_invitation_email(email, requestor_email, domains, requested_user):
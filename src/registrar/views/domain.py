@@ -5,11 +5,16 @@ authorized users can see information on a domain, every view here should
 inherit from `DomainPermissionView` (or DomainInvitationPermissionCancelView).
 """
 
+import copy
 from datetime import date
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Prefetch, prefetch_related_objects
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect, render, get_object_or_404
 from django.urls import reverse
@@ -72,6 +77,22 @@ from django import forms
 
 logger = logging.getLogger(__name__)
 
+# Placeholder security emails, which are shown and edited as if no security email was set
+DEFAULT_SECURITY_EMAILS = frozenset([DefaultEmail.PUBLIC_CONTACT_DEFAULT.value, DefaultEmail.LEGACY_DEFAULT.value])
+
+# send_update_notification sends a notification email for changes to any of these forms
+UPDATE_NOTIFICATION_FORM_LABELS = {
+    DomainSecurityEmailForm: "Security email",
+    DomainDnssecForm: "DNSSEC / DS Data",
+    DomainDsdataFormset: "DNSSEC / DS Data",
+    DomainOrgNameAddressForm: "Organization details",
+    SeniorOfficialContactForm: "Senior official",
+    NameserverFormset: "Name servers",
+}
+
+# forms of these types should not send notifications if they're part of a portfolio/Organization
+UPDATE_NOTIFICATION_PORTFOLIO_FORMS = frozenset([DomainOrgNameAddressForm, SeniorOfficialContactForm])
+
 
 class DomainBaseView(DomainPermissionView):
     """
@@ -85,6 +106,35 @@ class DomainBaseView(DomainPermissionView):
         context = self.get_context_data(object=self.object)
         return self.render_to_response(context)
 
+    def get_object(self, queryset=None):
+        """
+        Get the domain from the db. It is only fetched once per request, since
+        permission checks and the handler may each ask for it.
+        """
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, "_domain"):
+            self._domain = super().get_object()
+        return self._domain
+
+    def render_to_response(self, context, **response_kwargs):
+        """
+        Registry data is fetched while the template renders, so the domain is
+        cached in the session again once the response has been rendered.
+        """
+        response = super().render_to_response(context, **response_kwargs)
+        if hasattr(self, "session"):
+            response.add_post_render_callback(lambda response: self._update_session_with_domain())
+        return response
+
+    def get_domain_url(self, url_name):
+        """Reverse the named url for this domain. Each url is only resolved once per request."""
+        if not hasattr(self, "_domain_urls"):
+            self._domain_urls = {}
+        if url_name not in self._domain_urls:
+            self._domain_urls[url_name] = reverse(url_name, kwargs={"pk": self.object.pk})
+        return self._domain_urls[url_name]
+
     def _get_domain(self, request):
         """
         get domain from session cache or from db and set
@@ -109,7 +159,12 @@ class DomainBaseView(DomainPermissionView):
         update domain in the session cache
         """
         domain_pk = "domain:" + str(self.kwargs.get("pk"))
-        self.session[domain_pk] = self.object
+        # The session is pickled, so store a copy without the related objects (like domain_info)
+        # that Django cached on the domain. The registry data cached on it is kept.
+        domain = copy.copy(self.object)
+        domain._state.fields_cache = {}
+        domain.__dict__.pop("_prefetched_objects_cache", None)
+        self.session[domain_pk] = domain
 
 
 class DomainFormBaseView(DomainBaseView, FormMixin):
@@ -147,16 +202,25 @@ class DomainFormBaseView(DomainBaseView, FormMixin):
 
     def get_domain_info_from_domain(self) -> DomainInformation | None:
         """
-        Grabs the underlying domain_info object based off of self.object.name.
+        Grabs the underlying domain_info object based off of self.object.
         Returns None if nothing is found.
+        The result is kept for the rest of the request, so it is only queried once.
         """
-        _domain_info = DomainInformation.objects.filter(domain__name=self.object.name)
-        current_domain_info = None
-        if _domain_info.exists() and _domain_info.count() == 1:
-            current_domain_info = _domain_info.get()
-        else:
-            logger.error("Could get domain_info. No domain info exists, or duplicates exist.")
+        if hasattr(self, "_domain_info"):
+            return self._domain_info
+
+        # domain is a one to one field, so there is at most one match.
+        # Only the fields the domain views check are loaded.
+        current_domain_info = (
+            DomainInformation.objects.filter(domain_id=self.object.pk)
+            .select_related("portfolio", "senior_official")
+            .only("id", "domain_id", "generic_org_type", "portfolio", "senior_official")
+            .first()
+        )
+        if current_domain_info is None:
+            logger.error("Could get domain_info. No domain info exists.")
 
+        self._domain_info = current_domain_info
         return current_domain_info
 
     def send_update_notification(self, form, force_send=False):
@@ -167,33 +231,22 @@ class DomainFormBaseView(DomainBaseView, FormMixin):
         is set to True.
         """
 
-        # send notification email for changes to any of these forms
-        form_label_dict = {
-            DomainSecurityEmailForm: "Security email",
-            DomainDnssecForm: "DNSSEC / DS Data",
-            DomainDsdataFormset: "DNSSEC / DS Data",
-            DomainOrgNameAddressForm: "Organization details",
-            SeniorOfficialContactForm: "Senior official",
-            NameserverFormset: "Name servers",
-        }
-
-        # forms of these types should not send notifications if they're part of a portfolio/Organization
-        check_for_portfolio = {
-            DomainOrgNameAddressForm,
-            SeniorOfficialContactForm,
-        }
+        # Nothing changed, so skip the checks below (and their queries)
+        if not (form.has_changed() or force_send):
+            logger.info(f"No notification sent for {form.__class__}.")
+            return
 
         is_analyst_action = "analyst_action" in self.session and "analyst_action_location" in self.session
 
         should_notify = False
 
-        if form.__class__ in form_label_dict:
+        if form.__class__ in UPDATE_NOTIFICATION_FORM_LABELS:
             if is_analyst_action:
                 logger.debug("No notification sent: Action was conducted by an analyst")
             else:
                 # these types of forms can cause notifications
                 should_notify = True
-                if form.__class__ in check_for_portfolio:
+                if form.__class__ in UPDATE_NOTIFICATION_PORTFOLIO_FORMS:
                     # some forms shouldn't cause notifications if they are in a portfolio
                     info = self.get_domain_info_from_domain()
                     if not info or info.portfolio:
@@ -202,12 +255,12 @@ class DomainFormBaseView(DomainBaseView, FormMixin):
         else:
             # don't notify for any other types of forms
             should_notify = False
-        if should_notify and (form.has_changed() or force_send):
+        if should_notify:
             context = {
                 "domain": self.object.name,
                 "user": self.request.user,
                 "date": date.today(),
-                "changes": form_label_dict[form.__class__],
+                "changes": UPDATE_NOTIFICATION_FORM_LABELS[form.__class__],
             }
             self.email_domain_managers(
                 self.object,
@@ -230,15 +283,12 @@ class DomainFormBaseView(DomainBaseView, FormMixin):
 
         Will log a warning if the email fails to send for any reason, but will not raise an error.
         """
-        manager_pks = UserDomainRole.objects.filter(domain=domain.pk, role=UserDomainRole.Roles.MANAGER).values_list(
-            "user", flat=True
+        # Exclude the current user so they aren't CC'ed, since they will be the "to_address"
+        emails = list(
+            User.objects.filter(permissions__domain=domain.pk, permissions__role=UserDomainRole.Roles.MANAGER)
+            .exclude(email=self.request.user.email)  # type: ignore
+            .values_list("email", flat=True)
         )
-        emails = list(User.objects.filter(pk__in=manager_pks).values_list("email", flat=True))
-        try:
-            # Remove the current user so they aren't CC'ed, since they will be the "to_address"
-            emails.remove(self.request.user.email)  # type: ignore
-        except ValueError:
-            pass
 
         try:
             send_templated_email(
@@ -265,12 +315,10 @@ class DomainView(DomainBaseView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        default_emails = [DefaultEmail.PUBLIC_CONTACT_DEFAULT.value, DefaultEmail.LEGACY_DEFAULT.value]
-
-        context["hidden_security_emails"] = default_emails
+        context["hidden_security_emails"] = DEFAULT_SECURITY_EMAILS
 
         security_email = self.object.get_security_email()
-        if security_email is None or security_email in default_emails:
+        if security_email is None or security_email in DEFAULT_SECURITY_EMAILS:
             context["security_email"] = None
             return context
         context["security_email"] = security_email
@@ -282,24 +330,17 @@ class DomainView(DomainBaseView):
         this function."""
         portfolio = self.request.session.get("portfolio")
         if self.request.user.has_any_domains_portfolio_permission(portfolio):
-            if Domain.objects.filter(id=pk).exists():
-                domain = Domain.objects.get(id=pk)
-                if domain.domain_info.portfolio == portfolio:
-                    return True
+            domain = Domain.objects.filter(id=pk).select_related("domain_info__portfolio").first()
+            if domain and domain.domain_info.portfolio == portfolio:
+                return True
         return False
 
     def in_editable_state(self, pk):
         """Override in_editable_state from DomainPermission
         Allow detail page to be viewable"""
 
-        requested_domain = None
-        if Domain.objects.filter(id=pk).exists():
-            requested_domain = Domain.objects.get(id=pk)
-
         # return true if the domain exists, this will allow the detail page to load
-        if requested_domain:
-            return True
-        return False
+        return Domain.objects.filter(id=pk).exists()
 
     def _get_domain(self, request):
         """
@@ -368,7 +409,7 @@ class DomainOrgNameAddressView(DomainFormBaseView):
 
     def get_success_url(self):
         """Redirect to the overview page for the domain."""
-        return reverse("domain-org-name-address", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-org-name-address")
 
     def form_valid(self, form):
         """The form is valid, save the organization name and mailing address."""
@@ -412,6 +453,15 @@ class DomainSubOrganizationView(DomainFormBaseView):
         else:
             return False
 
+    def _get_domain(self, request):
+        """
+        Get the domain, then load the domain info this view reads (with its
+        suborganization and portfolio) in a single query.
+        """
+        super()._get_domain(request)
+        domain_info_query = DomainInformation.objects.select_related("sub_organization", "portfolio")
+        prefetch_related_objects([self.object], Prefetch("domain_info", queryset=domain_info_query))
+
     def get_context_data(self, **kwargs):
         """Adds custom context."""
         context = super().get_context_data(**kwargs)
@@ -427,7 +477,7 @@ class DomainSubOrganizationView(DomainFormBaseView):
 
     def get_success_url(self):
         """Redirect to the overview page for the domain."""
-        return reverse("domain-suborganization", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-suborganization")
 
     def form_valid(self, form):
         """The form is valid, save the organization name and mailing address."""
@@ -450,9 +500,10 @@ class DomainSeniorOfficialView(DomainFormBaseView):
     def get_form_kwargs(self, *args, **kwargs):
         """Add domain_info.senior_official instance to make a bound form."""
         form_kwargs = super().get_form_kwargs(*args, **kwargs)
-        form_kwargs["instance"] = self.object.domain_info.senior_official
-
+        # The domain info is fetched with its senior official, and kept for get_context_data
         domain_info = self.get_domain_info_from_domain()
+        form_kwargs["instance"] = domain_info.senior_official if domain_info else None
+
         invalid_fields = [DomainRequest.OrganizationChoices.FEDERAL, DomainRequest.OrganizationChoices.TRIBAL]
         is_federal_or_tribal = domain_info and (domain_info.generic_org_type in invalid_fields)
         form_kwargs["disable_fields"] = is_federal_or_tribal
@@ -461,12 +512,13 @@ class DomainSeniorOfficialView(DomainFormBaseView):
     def get_context_data(self, **kwargs):
         """Adds custom context."""
         context = super().get_context_data(**kwargs)
-        context["generic_org_type"] = self.object.domain_info.generic_org_type
+        domain_info = self.get_domain_info_from_domain()
+        context["generic_org_type"] = domain_info.generic_org_type if domain_info else None
         return context
 
     def get_success_url(self):
         """Redirect to the overview page for the domain."""
-        return reverse("domain-senior-official", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-senior-official")
 
     def form_valid(self, form):
         """The form is valid, save the senior official."""
@@ -538,10 +590,25 @@ class PrototypeDomainDNSRecordForm(forms.Form):
     )
 
 
+def get_cloudflare_session():
+    """
+    Returns a requests session for Cloudflare API calls. GETs are retried on rate limits
+    and gateway errors; the POSTs that create accounts, zones and records are not retried.
+    """
+    retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries))
+    return session
+
+
 class PrototypeDomainDNSRecordView(DomainFormBaseView):
     template_name = "prototype_domain_dns.html"
     form_class = PrototypeDomainDNSRecordForm
     valid_domains = ["igorville.gov", "domainops.gov", "dns.gov"]
+    # Seconds to cache the Cloudflare tenant, account and zone ids for
+    cloudflare_cache_timeout = 60 * 60 * 24
+    # Shared by all Cloudflare calls, so they reuse pooled keep-alive connections
+    cloudflare_session = get_cloudflare_session()
 
     def has_permission(self):
         has_permission = super().has_permission()
@@ -559,17 +626,154 @@ class PrototypeDomainDNSRecordView(DomainFormBaseView):
         return True
 
     def get_success_url(self):
-        return reverse("prototype-domain-dns", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("prototype-domain-dns")
 
     def find_by_name(self, items, name):
         """Find an item by name in a list of dictionaries."""
         return next((item.get("id") for item in items if item.get("name") == name), None)
 
+    def get_cloudflare_cache_key(self, name):
+        """Cache key for the Cloudflare account, zone or subscription found or created for this domain."""
+        return f"cloudflare:{name}:{self.object.name}"
+
+    def get_tenant_id(self, base_url, headers):
+        """Get the tenant id, from the cache if an earlier request already looked it up."""
+        tenant_cache_key = f"cloudflare:tenant:{settings.SECRET_REGISTRY_TENANT_NAME}"
+        tenant_id = cache.get(tenant_cache_key)
+        if tenant_id:
+            return tenant_id
+
+        params = {"tenant_name": settings.SECRET_REGISTRY_TENANT_NAME}
+        tenant_response = self.cloudflare_session.get(
+            f"{base_url}/user/tenants", headers=headers, params=params, timeout=5
+        )
+        tenant_response_json = tenant_response.json()
+        logger.info(f"Found tenant: {tenant_response_json}")
+        tenant_id = tenant_response_json["result"][0]["tenant_tag"]
+        self.errors = tenant_response_json.get("errors", [])
+        tenant_response.raise_for_status()
+
+        cache.set(tenant_cache_key, tenant_id, self.cloudflare_cache_timeout)
+        return tenant_id
+
+    def get_or_create_account_id(self, base_url, headers, tenant_id):
+        """Get or create the account for this domain under the tenant, caching its id."""
+        account_cache_key = self.get_cloudflare_cache_key("account")
+        account_id = cache.get(account_cache_key)
+        if account_id:
+            return account_id
+
+        # Check to see if the account already exists. Filters accounts by tenant_id / account_name.
+        account_name = f"account-{self.object.name}"
+        params = {"tenant_id": tenant_id, "name": account_name}
+
+        account_response = self.cloudflare_session.get(
+            f"{base_url}/accounts", headers=headers, params=params, timeout=5
+        )
+        account_response_json = account_response.json()
+        logger.debug(f"account get: {account_response_json}")
+        self.errors = account_response_json.get("errors", [])
+        account_response.raise_for_status()
+
+        # See if we already made an account.
+        # This maybe doesn't need to be a for loop (1 record or 0) but alas, here we are
+        accounts = account_response_json.get("result", [])
+        account_id = self.find_by_name(accounts, account_name)
+
+        # If we didn't, create one
+        if not account_id:
+            account_response = self.cloudflare_session.post(
+                f"{base_url}/accounts",
+                headers=headers,
+                json={"name": account_name, "type": "enterprise", "unit": {"id": tenant_id}},
+                timeout=5,
+            )
+            account_response_json = account_response.json()
+            logger.info(f"Created account: {account_response_json}")
+            account_id = account_response_json["result"]["id"]
+            self.errors = account_response_json.get("errors", [])
+            account_response.raise_for_status()
+
+        cache.set(account_cache_key, account_id, self.cloudflare_cache_timeout)
+        return account_id
+
+    def get_or_create_zone_id(self, base_url, headers, account_id):
+        """Get or create the zone for this domain under the account, caching its id."""
+        zone_cache_key = self.get_cloudflare_cache_key("zone")
+        zone_id = cache.get(zone_cache_key)
+        if zone_id:
+            return zone_id
+
+        # Try to find an existing zone first by searching on the current id
+        zone_name = self.object.name
+        params = {"account.id": account_id, "name": zone_name}
+        zone_response = self.cloudflare_session.get(f"{base_url}/zones", headers=headers, params=params, timeout=5)
+        zone_response_json = zone_response.json()
+        logger.debug(f"get zone: {zone_response_json}")
+        self.errors = zone_response_json.get("errors", [])
+        zone_response.raise_for_status()
+
+        # Get the zone id
+        zones = zone_response_json.get("result", [])
+        zone_id = self.find_by_name(zones, zone_name)
+
+        # Create one if it doesn't presently exist
+        if not zone_id:
+            zone_response = self.cloudflare_session.post(
+                f"{base_url}/zones",
+                headers=headers,
+                json={"name": zone_name, "account": {"id": account_id}, "type": "full"},
+                timeout=5,
+            )
+            zone_response_json = zone_response.json()
+            logger.info(f"Created zone: {zone_response_json}")
+            zone_id = zone_response_json.get("result", {}).get("id")
+            self.errors = zone_response_json.get("errors", [])
+            zone_response.raise_for_status()
+
+        cache.set(zone_cache_key, zone_id, self.cloudflare_cache_timeout)
+        return zone_id
+
+    def get_or_create_zone_subscription(self, base_url, headers, zone_id):
+        """
+        Make sure the zone has a subscription. Once it has, that is cached, so later
+        requests don't check again.
+        """
+        subscription_cache_key = self.get_cloudflare_cache_key("subscription")
+        if cache.get(subscription_cache_key):
+            return
+
+        # See if one already exists
+        subscription_response = self.cloudflare_session.get(
+            f"{base_url}/zones/{zone_id}/subscription", headers=headers, timeout=5
+        )
+        subscription_response_json = subscription_response.json()
+        logger.debug(f"get subscription: {subscription_response_json}")
+
+        # Create a subscription if one doesn't exist already.
+        # If it doesn't, we get this error message (code 1207):
+        # Add a core subscription first and try again. The zone does not have an active core subscription.
+        # Note that status code and error code are different here.
+        if subscription_response.status_code == 404:
+            subscription_response = self.cloudflare_session.post(
+                f"{base_url}/zones/{zone_id}/subscription",
+                headers=headers,
+                json={"rate_plan": {"id": "PARTNERS_ENT"}, "frequency": "annual"},
+                timeout=5,
+            )
+            subscription_response.raise_for_status()
+            subscription_response_json = subscription_response.json()
+            logger.info(f"Created subscription: {subscription_response_json}")
+        else:
+            subscription_response.raise_for_status()
+
+        cache.set(subscription_cache_key, True, self.cloudflare_cache_timeout)
+
     def post(self, request, *args, **kwargs):
         """Handle form submission."""
         self.object = self.get_object()
         form = self.get_form()
-        errors = []
+        self.errors = []
         if form.is_valid():
             try:
                 if settings.IS_PRODUCTION and self.object.name != "igorville.gov":
@@ -587,105 +791,22 @@ class PrototypeDomainDNSRecordView(DomainFormBaseView):
                     "X-Auth-Key": settings.SECRET_REGISTRY_TENANT_KEY,
                     "Content-Type": "application/json",
                 }
-                params = {"tenant_name": settings.SECRET_REGISTRY_TENANT_NAME}
 
                 # 1. Get tenant details
-                tenant_response = requests.get(f"{base_url}/user/tenants", headers=headers, params=params, timeout=5)
-                tenant_response_json = tenant_response.json()
-                logger.info(f"Found tenant: {tenant_response_json}")
-                tenant_id = tenant_response_json["result"][0]["tenant_tag"]
-                errors = tenant_response_json.get("errors", [])
-                tenant_response.raise_for_status()
+                tenant_id = self.get_tenant_id(base_url, headers)
 
                 # 2. Create or get a account under tenant
-
-                # Check to see if the account already exists. Filters accounts by tenant_id / account_name.
-                account_name = f"account-{self.object.name}"
-                params = {"tenant_id": tenant_id, "name": account_name}
-
-                account_response = requests.get(f"{base_url}/accounts", headers=headers, params=params, timeout=5)
-                account_response_json = account_response.json()
-                logger.debug(f"account get: {account_response_json}")
-                errors = account_response_json.get("errors", [])
-                account_response.raise_for_status()
-
-                # See if we already made an account.
-                # This maybe doesn't need to be a for loop (1 record or 0) but alas, here we are
-                accounts = account_response_json.get("result", [])
-                account_id = self.find_by_name(accounts, account_name)
-
-                # If we didn't, create one
-                if not account_id:
-                    account_response = requests.post(
-                        f"{base_url}/accounts",
-                        headers=headers,
-                        json={"name": account_name, "type": "enterprise", "unit": {"id": tenant_id}},
-                        timeout=5,
-                    )
-                    account_response_json = account_response.json()
-                    logger.info(f"Created account: {account_response_json}")
-                    account_id = account_response_json["result"]["id"]
-                    errors = account_response_json.get("errors", [])
-                    account_response.raise_for_status()
+                account_id = self.get_or_create_account_id(base_url, headers, tenant_id)
 
                 # 3. Create or get a zone under account
-
-                # Try to find an existing zone first by searching on the current id
-                zone_name = self.object.name
-                params = {"account.id": account_id, "name": zone_name}
-                zone_response = requests.get(f"{base_url}/zones", headers=headers, params=params, timeout=5)
-                zone_response_json = zone_response.json()
-                logger.debug(f"get zone: {zone_response_json}")
-                errors = zone_response_json.get("errors", [])
-                zone_response.raise_for_status()
-
-                # Get the zone id
-                zones = zone_response_json.get("result", [])
-                zone_id = self.find_by_name(zones, zone_name)
-
-                # Create one if it doesn't presently exist
-                if not zone_id:
-                    zone_response = requests.post(
-                        f"{base_url}/zones",
-                        headers=headers,
-                        json={"name": zone_name, "account": {"id": account_id}, "type": "full"},
-                        timeout=5,
-                    )
-                    zone_response_json = zone_response.json()
-                    logger.info(f"Created zone: {zone_response_json}")
-                    zone_id = zone_response_json.get("result", {}).get("id")
-                    errors = zone_response_json.get("errors", [])
-                    zone_response.raise_for_status()
+                zone_id = self.get_or_create_zone_id(base_url, headers, account_id)
 
                 # 4. Add or get a zone subscription
-
-                # See if one already exists
-                subscription_response = requests.get(
-                    f"{base_url}/zones/{zone_id}/subscription", headers=headers, timeout=5
-                )
-                subscription_response_json = subscription_response.json()
-                logger.debug(f"get subscription: {subscription_response_json}")
-
-                # Create a subscription if one doesn't exist already.
-                # If it doesn't, we get this error message (code 1207):
-                # Add a core subscription first and try again. The zone does not have an active core subscription.
-                # Note that status code and error code are different here.
-                if subscription_response.status_code == 404:
-                    subscription_response = requests.post(
-                        f"{base_url}/zones/{zone_id}/subscription",
-                        headers=headers,
-                        json={"rate_plan": {"id": "PARTNERS_ENT"}, "frequency": "annual"},
-                        timeout=5,
-                    )
-                    subscription_response.raise_for_status()
-                    subscription_response_json = subscription_response.json()
-                    logger.info(f"Created subscription: {subscription_response_json}")
-                else:
-                    subscription_response.raise_for_status()
+                self.get_or_create_zone_subscription(base_url, headers, zone_id)
 
                 # # 5. Create DNS record
                 # # Format the DNS record according to Cloudflare's API requirements
-                dns_response = requests.post(
+                dns_response = self.cloudflare_session.post(
                     f"{base_url}/zones/{zone_id}/dns_records",
                     headers=headers,
                     json={
@@ -699,16 +820,18 @@ class PrototypeDomainDNSRecordView(DomainFormBaseView):
                 )
                 dns_response_json = dns_response.json()
                 logger.info(f"Created DNS record: {dns_response_json}")
-                errors = dns_response_json.get("errors", [])
+                self.errors = dns_response_json.get("errors", [])
                 dns_response.raise_for_status()
                 dns_name = dns_response_json["result"]["name"]
                 messages.success(request, f"DNS A record '{dns_name}' created successfully.")
             except Exception as err:
+                # A cached account, zone or subscription may no longer exist, so look them up again next time
+                cache.delete_many([self.get_cloudflare_cache_key(name) for name in ("account", "zone", "subscription")])
                 logger.error(f"Error creating DNS A record for {self.object.name}: {err}")
                 messages.error(request, f"An error occurred: {err}")
             finally:
-                if errors:
-                    messages.error(request, f"Request errors: {errors}")
+                if self.errors:
+                    messages.error(request, f"Request errors: {self.errors}")
         return super().post(request)
 
 
@@ -728,15 +851,14 @@ class DomainNameserversView(DomainFormBaseView):
             # Add existing nameservers as initial data
             initial_data.extend({"server": name, "ip": ",".join(ip)} for name, ip in nameservers)
 
-        # Ensure at least 3 fields, filled or empty
-        while len(initial_data) < 2:
-            initial_data.append({})
+        # Ensure at least 2 fields, filled or empty. Each needs its own dict.
+        initial_data.extend({} for _ in range(2 - len(initial_data)))
 
         return initial_data
 
     def get_success_url(self):
         """Redirect to the nameservers page for the domain."""
-        return reverse("domain-dns-nameservers", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-dns-nameservers")
 
     def get_context_data(self, **kwargs):
         """Adjust context from FormMixin for formsets."""
@@ -784,7 +906,6 @@ class DomainNameserversView(DomainFormBaseView):
     def form_valid(self, formset):
         """The formset is valid, perform something with it."""
 
-        self.request.session["nameservers_form_domain"] = self.object
         initial_state = self.object.state
 
         # Set the nameservers from the formset
@@ -857,7 +978,7 @@ class DomainDNSSECView(DomainFormBaseView):
 
     def get_success_url(self):
         """Redirect to the DNSSEC page for the domain."""
-        return reverse("domain-dns-dnssec", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-dns-dnssec")
 
     def post(self, request, *args, **kwargs):
         """Form submission posts to this view."""
@@ -869,7 +990,7 @@ class DomainDNSSECView(DomainFormBaseView):
                     self.object.dnssecdata = {}
                 except RegistryError as err:
                     errmsg = "Error removing existing DNSSEC record(s)."
-                    logger.error(errmsg + ": " + err)
+                    logger.error("%s: %s", errmsg, err)
                     messages.error(self.request, errmsg)
                 else:
                     self.send_update_notification(form, force_send=True)
@@ -883,9 +1004,18 @@ class DomainDsDataView(DomainFormBaseView):
     form_class = DomainDsdataFormset
     form = DomainDsdataForm
 
+    def get_dnssecdata(self) -> extensions.DNSSECExtension | None:
+        """Returns the domain's dnssecdata, read from the registry once per request.
+
+        A domain without dnssecdata is not held in the registry cache, so each
+        access of the property would otherwise repeat the EPP info call."""
+        if not hasattr(self, "_dnssecdata"):
+            self._dnssecdata = self.object.dnssecdata
+        return self._dnssecdata
+
     def get_initial(self):
         """The initial value for the form (which is a formset here)."""
-        dnssecdata: extensions.DNSSECExtension = self.object.dnssecdata
+        dnssecdata = self.get_dnssecdata()
         initial_data = []
 
         if dnssecdata is not None and dnssecdata.dsData is not None:
@@ -908,7 +1038,7 @@ class DomainDsDataView(DomainFormBaseView):
 
     def get_success_url(self):
         """Redirect to the DS data page for the domain."""
-        return reverse("domain-dns-dnssec-dsdata", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-dns-dnssec-dsdata")
 
     def get_context_data(self, **kwargs):
         """Adjust context from FormMixin for formsets."""
@@ -955,24 +1085,18 @@ class DomainDsDataView(DomainFormBaseView):
         # Set the dnssecdata from the formset
         dnssecdata = extensions.DNSSECExtension()
 
-        for form in formset:
-            try:
-                # if 'delete' not in form.cleaned_data
-                # or form.cleaned_data['delete'] == False:
-                dsrecord = {
-                    "keyTag": form.cleaned_data["key_tag"],
-                    "alg": int(form.cleaned_data["algorithm"]),
-                    "digestType": int(form.cleaned_data["digest_type"]),
-                    "digest": form.cleaned_data["digest"],
-                }
-                if dnssecdata.dsData is None:
-                    dnssecdata.dsData = []
-                dnssecdata.dsData.append(common.DSData(**dsrecord))
-            except KeyError:
-                # no cleaned_data provided for this form, but passed
-                # as valid; this can happen if form has been added but
-                # not been interacted with; in that case, want to ignore
-                pass
+        # forms which have been added but not interacted with are valid
+        # without cleaned_data, so only complete records are built
+        dnssecdata.dsData = [
+            common.DSData(
+                keyTag=cleaned_data["key_tag"],
+                alg=int(cleaned_data["algorithm"]),
+                digestType=int(cleaned_data["digest_type"]),
+                digest=cleaned_data["digest"],
+            )
+            for cleaned_data in (form.cleaned_data for form in formset)
+            if all(field in cleaned_data for field in ("key_tag", "algorithm", "digest_type", "digest"))
+        ] or None
         try:
             self.object.dnssecdata = dnssecdata
         except RegistryError as err:
@@ -981,10 +1105,10 @@ class DomainDsDataView(DomainFormBaseView):
                     self.request,
                     GenericError(code=GenericErrorCodes.CANNOT_CONTACT_REGISTRY),
                 )
-                logger.error(f"Registry connection error: {err}")
+                logger.error("Registry connection error: %s", err)
             else:
                 messages.error(self.request, DsDataError(code=DsDataErrorCodes.BAD_DATA))
-                logger.error(f"Registry error: {err}")
+                logger.error("Registry error: %s", err)
             return self.form_invalid(formset)
         else:
             self.send_update_notification(formset)
@@ -1005,8 +1129,7 @@ class DomainSecurityEmailView(DomainFormBaseView):
         initial = super().get_initial()
         security_contact = self.object.security_contact
 
-        invalid_emails = [DefaultEmail.PUBLIC_CONTACT_DEFAULT.value, DefaultEmail.LEGACY_DEFAULT.value]
-        if security_contact is None or security_contact.email in invalid_emails:
+        if security_contact is None or security_contact.email in DEFAULT_SECURITY_EMAILS:
             initial["security_email"] = None
             return initial
         initial["security_email"] = security_contact.email
@@ -1014,7 +1137,7 @@ class DomainSecurityEmailView(DomainFormBaseView):
 
     def get_success_url(self):
         """Redirect to the security email page for the domain."""
-        return reverse("domain-security-email", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-security-email")
 
     def form_valid(self, form):
         """The form is valid, call setter in model."""
@@ -1047,13 +1170,13 @@ class DomainSecurityEmailView(DomainFormBaseView):
                     self.request,
                     GenericError(code=GenericErrorCodes.CANNOT_CONTACT_REGISTRY),
                 )
-                logger.error(f"Registry connection error: {Err}")
+                logger.error("Registry connection error: %s", Err)
             else:
                 messages.error(self.request, SecurityEmailError(code=SecurityEmailErrorCodes.BAD_DATA))
-                logger.error(f"Registry error: {Err}")
+                logger.error("Registry error: %s", Err)
         except ContactError as Err:
             messages.error(self.request, SecurityEmailError(code=SecurityEmailErrorCodes.BAD_DATA))
-            logger.error(f"Generic registry error: {Err}")
+            logger.error("Generic registry error: %s", Err)
         else:
             self.send_update_notification(form)
             messages.success(self.request, "The security email for this domain has been updated.")
@@ -1091,37 +1214,26 @@ class DomainUsersView(DomainBaseView):
 
         return context
 
-    def get(self, request, *args, **kwargs):
-        """Get method for DomainUsersView."""
-        # Call the parent class's `get` method to get the response and context
-        response = super().get(request, *args, **kwargs)
-
-        # Ensure context is available after the parent call
-        context = response.context_data if hasattr(response, "context_data") else {}
-
-        # Check if context contains `domain_managers_roles` and its length is 1
-        if context.get("domain_manager_roles") and len(context["domain_manager_roles"]) == 1:
-            # Add an info message
-            messages.info(request, "This domain has one manager. Adding more can prevent issues.")
-
-        return response
-
     def _add_domain_manager_roles_to_context(self, context, portfolio):
         """Add domain_manager_roles to context separately, as roles need admin indicator."""
 
-        # Prepare a list to store roles with an admin flag
-        domain_manager_roles = []
+        # Determine if each manager has the ORGANIZATION_ADMIN role on this portfolio in the same query.
+        # Portfolio permissions always have a portfolio, so there is no admin flag without one.
+        admin_permissions = UserPortfolioPermission.objects.filter(
+            user_id=OuterRef("user_id"),
+            portfolio=portfolio,
+            roles__contains=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN],
+        )
+        permissions = self.object.permissions.select_related("user").annotate(has_admin_flag=Exists(admin_permissions))
 
-        for permission in self.object.permissions.all():
-            # Determine if the user has the ORGANIZATION_ADMIN role
-            has_admin_flag = any(
-                UserPortfolioRoleChoices.ORGANIZATION_ADMIN in portfolio_permission.roles
-                and portfolio == portfolio_permission.portfolio
-                for portfolio_permission in permission.user.portfolio_permissions.all()
-            )
+        # Add each role along with the computed flag to the list
+        domain_manager_roles = [
+            {"permission": permission, "has_admin_flag": permission.has_admin_flag} for permission in permissions
+        ]
 
-            # Add the role along with the computed flag to the list
-            domain_manager_roles.append({"permission": permission, "has_admin_flag": has_admin_flag})
+        if len(domain_manager_roles) == 1:
+            # Add an info message. The page is rendered after this, so it is shown there.
+            messages.info(self.request, "This domain has one manager. Adding more can prevent issues.")
 
         # Pass roles_with_flags to the context
         context["domain_manager_roles"] = domain_manager_roles
@@ -1131,31 +1243,23 @@ class DomainUsersView(DomainBaseView):
     def _add_invitations_to_context(self, context, portfolio):
         """Add invitations to context separately as invitations needs admin indicator."""
 
-        # Prepare a list to store invitations with an admin flag
-        invitations = []
+        domain_invitations = self.object.invitations.exclude(status=DomainInvitation.DomainInvitationStatus.CANCELED)
 
-        for domain_invitation in self.object.invitations.all():
-            # Check if there are any PortfolioInvitations linked to the same portfolio with the ORGANIZATION_ADMIN role
-            has_admin_flag = False
-
-            # Query PortfolioInvitations linked to the same portfolio and check roles
-            portfolio_invitations = PortfolioInvitation.objects.filter(
-                portfolio=portfolio, email=domain_invitation.email
-            )
-
-            # If any of the PortfolioInvitations have the ORGANIZATION_ADMIN role, set the flag to True
-            for portfolio_invitation in portfolio_invitations:
-                if (
-                    portfolio_invitation.roles
-                    and UserPortfolioRoleChoices.ORGANIZATION_ADMIN in portfolio_invitation.roles
-                ):
-                    has_admin_flag = True
-                    break  # Once we find one match, no need to check further
+        # Find which of the invited emails have a PortfolioInvitation to the same portfolio
+        # with the ORGANIZATION_ADMIN role, in one query for all of them
+        admin_emails = set(
+            PortfolioInvitation.objects.filter(
+                portfolio=portfolio,
+                email__in=[domain_invitation.email for domain_invitation in domain_invitations],
+                roles__contains=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN],
+            ).values_list("email", flat=True)
+        )
 
-            # Add the role along with the computed flag to the list if the domain invitation
-            # if the status is not canceled
-            if domain_invitation.status != "canceled":
-                invitations.append({"domain_invitation": domain_invitation, "has_admin_flag": has_admin_flag})
+        # Add the invitation along with the computed flag to the list
+        invitations = [
+            {"domain_invitation": domain_invitation, "has_admin_flag": domain_invitation.email in admin_emails}
+            for domain_invitation in domain_invitations
+        ]
 
         # Pass roles_with_flags to the context
         context["invitations"] = invitations
@@ -1171,7 +1275,8 @@ class DomainUsersView(DomainBaseView):
             domain_pk = self.kwargs["pk"]
             # Prevent the end user from deleting themselves as a manager if they are the
             # only manager that exists on a domain.
-            can_delete_users = UserDomainRole.objects.filter(domain__id=domain_pk).count() > 1
+            # A second role is enough to know, so Postgres can stop there instead of counting them all
+            can_delete_users = UserDomainRole.objects.filter(domain_id=domain_pk)[1:2].exists()
 
         context["can_delete_users"] = can_delete_users
         return context
@@ -1188,7 +1293,7 @@ class DomainAddUserView(DomainFormBaseView):
     form_class = DomainAddUserForm
 
     def get_success_url(self):
-        return reverse("domain-users", kwargs={"pk": self.object.pk})
+        return self.get_domain_url("domain-users")
 
     def form_valid(self, form):
         """Add the specified user to this domain."""
@@ -1203,9 +1308,12 @@ class DomainAddUserView(DomainFormBaseView):
         # requestor can only send portfolio invitations if they are staff or if they are a member
         # of the domain's portfolio
         requestor_can_update_portfolio = (
-            UserPortfolioPermission.objects.filter(user=requestor, portfolio=domain_org).first() is not None
-            or requestor.is_staff
+            requestor.is_staff or UserPortfolioPermission.objects.filter(user=requestor, portfolio=domain_org).exists()
         )
+        # Evaluate the flags once, each lookup builds a fresh request and goes through waffle's cache
+        portfolio_invitations_enabled = flag_is_active_for_user(
+            requestor, "organization_feature"
+        ) and not flag_is_active_for_user(requestor, "multiple_portfolios")
 
         member_of_a_different_org, member_of_this_org = get_org_membership(domain_org, requested_email, requested_user)
         try:
@@ -1217,8 +1325,7 @@ class DomainAddUserView(DomainFormBaseView):
             #   create portfolio invitation
             #   create message to view
             if (
-                flag_is_active_for_user(requestor, "organization_feature")
-                and not flag_is_active_for_user(requestor, "multiple_portfolios")
+                portfolio_invitations_enabled
                 and domain_org is not None
                 and requestor_can_update_portfolio
                 and not member_of_this_org
@@ -1262,12 +1369,15 @@ class DomainAddUserView(DomainFormBaseView):
             is_member_of_different_org=member_of_different_org,
             requested_user=requested_user,
         )
-        UserDomainRole.objects.create(
+        _, created = UserDomainRole.objects.get_or_create(
             user=requested_user,
             domain=self.object,
-            role=UserDomainRole.Roles.MANAGER,
+            defaults={"role": UserDomainRole.Roles.MANAGER},
         )
-        messages.success(self.request, f"Added user {email}.")
+        if created:
+            messages.success(self.request, f"Added user {email}.")
+        else:
+            messages.warning(self.request, f"{email} is already a manager for this domain")
 
 
 class DomainInvitationCancelView(SuccessMessageMixin, DomainInvitationPermissionCancelView):
@@ -1289,7 +1399,8 @@ class DomainInvitationCancelView(SuccessMessageMixin, DomainInvitationPermission
             return HttpResponseRedirect(self.get_success_url())
 
     def get_success_url(self):
-        return reverse("domain-users", kwargs={"pk": self.object.domain.id})
+        # The domain's id is already on the invitation, so the domain itself isn't fetched
+        return reverse("domain-users", kwargs={"pk": self.object.domain_id})
 
     def get_success_message(self, cleaned_data):
         return f"Canceled invitation to {self.object.email}."
@@ -1304,7 +1415,8 @@ class DomainDeleteUserView(UserDomainRolePermissionDeleteView):
         """Custom get_object definition to grab a UserDomainRole object from a domain_id and user_id"""
         domain_id = self.kwargs.get("pk")
         user_id = self.kwargs.get("user_pk")
-        return UserDomainRole.objects.get(domain=domain_id, user=user_id)
+        # The user and domain are both used for the success message, so join them in here
+        return UserDomainRole.objects.select_related("user", "domain").get(domain=domain_id, user=user_id)
 
     def get_success_url(self):
         """Refreshes the page after a delete is successful"""
@@ -34,7 +34,7 @@ from django.views.generic import View
 from django.views.generic.edit import FormMixin
 from django.db import IntegrityError
 
-from registrar.views.utility.invitation_helper import get_org_membership
+from registrar.views.utility.invitation_helper import EMAIL_INVITATION_ERROR_MESSAGE, get_org_membership
 
 
 logger = logging.getLogger(__name__)
@@ -799,7 +799,7 @@ class PortfolioAddMemberView(PortfolioMembersPermissionView, FormMixin):
                 portfolio,
                 exc_info=True,
             )
-            messages.warning(self.request, "Could not send email invitation.")
+            messages.warning(self.request, EMAIL_INVITATION_ERROR_MESSAGE)
         elif isinstance(exception, MissingEmailError):
             messages.error(self.request, str(exception))
             logger.error(
@@ -808,4 +808,4 @@ class PortfolioAddMemberView(PortfolioMembersPermissionView, FormMixin):
             )
         else:
             logger.warning("Could not send email invitation (Other Exception)", exc_info=True)
-            messages.warning(self.request, "Could not send email invitation.")
+            messages.warning(self.request, EMAIL_INVITATION_ERROR_MESSAGE)
@@ -13,6 +13,9 @@ from registrar.utility.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Shown to the requestor whenever an invitation email fails for a reason they can't act on
+EMAIL_INVITATION_ERROR_MESSAGE = "Could not send email invitation."
+
 # These methods are used by multiple views which share similar logic and function
 # when creating invitations and sending associated emails. These can be reused in
 # any view, and were initially developed for domain.py, portfolios.py and admin.py
@@ -33,18 +36,23 @@ def get_org_membership(org, email, user):
     situations where a user or email belongs to multiple organizations.
     """
 
-    # Check for existing permissions or invitations for the user
-    existing_org_permission = UserPortfolioPermission.objects.filter(user=user).first()
-    existing_org_invitation = PortfolioInvitation.objects.filter(email=email).first()
+    # Check for existing permissions or invitations for the user, only their portfolio ids are compared
+    org_id = org.id if org is not None else None
+    existing_org_permission_id = (
+        UserPortfolioPermission.objects.filter(user=user).values_list("portfolio_id", flat=True).first()
+    )
+    existing_org_invitation_id = (
+        PortfolioInvitation.objects.filter(email=email).values_list("portfolio_id", flat=True).first()
+    )
 
     # Determine membership in a different organization
-    member_of_a_different_org = (existing_org_permission and existing_org_permission.portfolio != org) or (
-        existing_org_invitation and existing_org_invitation.portfolio != org
+    member_of_a_different_org = (existing_org_permission_id is not None and existing_org_permission_id != org_id) or (
+        existing_org_invitation_id is not None and existing_org_invitation_id != org_id
     )
 
     # Determine membership in the same organization
-    member_of_this_org = (existing_org_permission and existing_org_permission.portfolio == org) or (
-        existing_org_invitation and existing_org_invitation.portfolio == org
+    member_of_this_org = (existing_org_permission_id is not None and existing_org_permission_id == org_id) or (
+        existing_org_invitation_id is not None and existing_org_invitation_id == org_id
     )
 
     return member_of_a_different_org, member_of_this_org
@@ -61,11 +69,13 @@ def get_requested_user(email):
 def handle_invitation_exceptions(request, exception, email):
     """Handle exceptions raised during the process."""
     if isinstance(exception, EmailSendingError):
-        logger.warning(str(exception), exc_info=True)
-        messages.error(request, str(exception))
+        message = str(exception)
+        logger.warning(message, exc_info=True)
+        messages.error(request, message)
     elif isinstance(exception, MissingEmailError):
-        messages.error(request, str(exception))
-        logger.error(str(exception), exc_info=True)
+        message = str(exception)
+        messages.error(request, message)
+        logger.error(message, exc_info=True)
     elif isinstance(exception, OutsideOrgMemberError):
         logger.warning(
             "Could not send email. Can not invite member of a .gov organization to a different organization.",
@@ -83,4 +93,4 @@ def handle_invitation_exceptions(request, exception, email):
         messages.warning(request, f"{email} is already a manager for this domain")
     else:
         logger.warning("Could not send email invitation (Other Exception)", exc_info=True)
-        messages.warning(request, "Could not send email invitation.")
+        messages.warning(request, EMAIL_INVITATION_ERROR_MESSAGE)